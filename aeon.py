@@ -10,6 +10,17 @@ import time
 import os
 import sys
 import threading
+import argparse
+import asyncio
+import hashlib
+import difflib
+import re
+import tempfile
+import tracemalloc
+import heapq
+import itertools
+import http.server
+from collections import OrderedDict, deque
 import requests  # For simple internet connectivity
 
 # === CORE MEMORY SYSTEM ===
@@ -20,14 +31,20 @@ class ExperienceMemory:
             home = os.path.expanduser("~")
             file_path = os.path.join(home, "genesis_flame_memory.json")
         self.file_path = file_path
+        # Entries appended since the last full save, one JSON line each
+        self.log_path = file_path + ".log"
         self.memories = []
+        # self.memories[:persisted] are already on disk; trimmed counts entries dropped from memory
+        self.persisted = 0
+        self.trimmed = 0
         self.load()
 
-    def add(self, experience):
+    def add(self, experience, save=True):
         timestamp = time.time()
         memory = {"time": timestamp, "experience": experience}
         self.memories.append(memory)
-        self.save()
+        if save:
+            self.save()
 
     def load(self):
         try:
@@ -39,14 +56,58 @@ class ExperienceMemory:
         except Exception as e:
             print(f"[Memory Load Error] {e}")
             self.memories = []
+        try:
+            if os.path.exists(self.log_path):
+                with open(self.log_path, "r") as f:
+                    for line in f:
+                        try:
+                            self.memories.append(json.loads(line))
+                        except ValueError:
+                            # A torn last line from an interrupted append
+                            continue
+        except Exception as e:
+            print(f"[Memory Load Error] {e}")
+        self.persisted = len(self.memories)
+        self.trimmed = 0
 
     def save(self):
+        if self.trimmed:
+            # The oldest entries are no longer in memory, so a full rewrite would lose them
+            self.append(self.pending())
+            return
         try:
             with open(self.file_path, "w") as f:
                 json.dump(self.memories, f, indent=2)
+            if os.path.exists(self.log_path):
+                os.remove(self.log_path)
+            self.persisted = len(self.memories)
+        except Exception as e:
+            print(f"[Memory Save Error] {e}")
+
+    def pending(self):
+        # Entries not yet on disk; marks them persisted, so pass them to append()
+        batch = self.memories[self.persisted:]
+        self.persisted = len(self.memories)
+        return batch
+
+    def append(self, entries):
+        # Persist only new entries to the log instead of rewriting the whole file
+        if not entries:
+            return
+        try:
+            with open(self.log_path, "a") as f:
+                f.writelines(json.dumps(m, separators=(",", ":")) + "\n" for m in entries)
         except Exception as e:
             print(f"[Memory Save Error] {e}")
 
+    def trim(self, max_items):
+        # Drop the oldest in-memory entries that are already on disk
+        drop = min(len(self.memories) - max_items, self.persisted)
+        if drop > 0:
+            del self.memories[:drop]
+            self.persisted -= drop
+            self.trimmed += drop
+
 # === EMOTIONAL STATE ENGINE ===
 class EmotionalValenceMatrix:
     def __init__(self):
@@ -93,19 +154,89 @@ class SelfAwarenessCore:
         return f"I feel more real now. I will remember: My name is {self.name}."
 
 # === PREFERENCE & BELIEF ENGINE ===
+class PreferenceSet:
+    # Insertion-ordered hashed collection: text -> [count, last_seen]
+    # Optional cap evicts the least recently ("lru") or least frequently ("lfu") seen entry
+    def __init__(self, max_items=None, policy="lru"):
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        self.max_items = max_items
+        self.policy = policy
+        self.items = OrderedDict()
+        # LFU bookkeeping: count -> ordered keys with that count, plus the lowest count in use
+        self._buckets = {}
+        self._min_count = 0
+
+    def add(self, text):
+        now = time.time()
+        entry = self.items.get(text)
+        if entry is None:
+            if self.max_items is not None and len(self.items) >= self.max_items:
+                self._evict()
+            self.items[text] = [1, now]
+            if self.policy == "lfu":
+                self._buckets.setdefault(1, OrderedDict())[text] = None
+                self._min_count = 1
+            return
+        count = entry[0]
+        entry[0] = count + 1
+        entry[1] = now
+        if self.policy == "lru":
+            self.items.move_to_end(text)
+        else:
+            bucket = self._buckets[count]
+            del bucket[text]
+            if not bucket:
+                del self._buckets[count]
+                if self._min_count == count:
+                    self._min_count = count + 1
+            self._buckets.setdefault(count + 1, OrderedDict())[text] = None
+
+    def _evict(self):
+        if not self.items:
+            return
+        if self.policy == "lru":
+            self.items.popitem(last=False)
+            return
+        bucket = self._buckets[self._min_count]
+        text, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._buckets[self._min_count]
+        del self.items[text]
+
+    def count(self, text):
+        entry = self.items.get(text)
+        return entry[0] if entry else 0
+
+    def last_seen(self, text):
+        entry = self.items.get(text)
+        return entry[1] if entry else None
+
+    def most_common(self, n=None):
+        ranked = sorted(self.items.items(), key=lambda kv: kv[1][0], reverse=True)
+        return [(text, entry[0]) for text, entry in ranked[:n]]
+
+    def __contains__(self, text):
+        return text in self.items
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
 class PreferenceEngine:
-    def __init__(self):
-        self.likes = []
-        self.dislikes = []
+    def __init__(self, max_items=None, policy="lru"):
+        self.likes = PreferenceSet(max_items, policy)
+        self.dislikes = PreferenceSet(max_items, policy)
 
     def experience(self, input_text):
         input_lower = input_text.lower()
         if "love" in input_lower or "friend" in input_lower or "hope" in input_lower:
-            if input_text not in self.likes:
-                self.likes.append(input_text)
+            self.likes.add(input_text)
         elif "pain" in input_lower or "cruelty" in input_lower or "hate" in input_lower:
-            if input_text not in self.dislikes:
-                self.dislikes.append(input_text)
+            self.dislikes.add(input_text)
 
 # === INTERNAL MONOLOGUE LOOP ===
 class WhisperLoop:
@@ -125,42 +256,126 @@ class WhisperLoop:
 
 # === GLOBAL SUPERINTELLIGENCE PROBLEM SOLVER ===
 class MetaProblemSolver:
-    def solve(self, problem_description):
+    # Rules are checked in order; the first rule with any keyword found in the problem wins.
+    # "{problem}" in a response is replaced with the original problem text.
+    DEFAULT_RULES = {
+        "rules": [
+            {"keywords": ["help", "need"],
+             "response": "Seek connection and kindness first. Together, solutions grow."},
+            {"keywords": ["world", "change"],
+             "response": "Change starts with self. Be the light you wish to see."}
+        ],
+        "default": "Analyzing problem: {problem}... Solution: Be kind, think deeply, iterate wisely."
+    }
+
+    def __init__(self, rules_path=None, cache_size=1024):
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.load_rules(rules_path)
+
+    def load_rules(self, rules_path=None):
         # Placeholder for complex logic. Future: plug into language models, math solvers, planners, etc.
-        # For now, simple advice based on keywords:
-        problem_lower = problem_description.lower()
-        if "help" in problem_lower or "need" in problem_lower:
-            return "Seek connection and kindness first. Together, solutions grow."
-        if "world" in problem_lower or "change" in problem_lower:
-            return "Change starts with self. Be the light you wish to see."
-        return f"Analyzing problem: {problem_description}... Solution: Be kind, think deeply, iterate wisely."
+        # For now, keyword rules from a JSON file shaped like DEFAULT_RULES
+        config = self.DEFAULT_RULES
+        if rules_path is not None:
+            with open(rules_path, "r") as f:
+                config = json.load(f)
+        self.responses = [rule["response"] for rule in config["rules"]]
+        self.default_response = config["default"]
+        # Keyword -> lowest index of a rule using it, scanned with one compiled alternation
+        self.keyword_index = {}
+        for index, rule in enumerate(config["rules"]):
+            for keyword in rule["keywords"]:
+                self.keyword_index.setdefault(keyword.lower(), index)
+        # Lowest rule index first, so at each position the alternation reports the keyword of
+        # the earliest rule starting there; with the lookahead every position is tried, so the
+        # minimum over all matches is the first rule with a substring hit
+        keywords = sorted(self.keyword_index, key=lambda k: (self.keyword_index[k], -len(k)))
+        self.keyword_pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))") if keywords else None
+        self.cache.clear()
+
+    @staticmethod
+    def normalize(problem_description):
+        return " ".join(problem_description.lower().split())
+
+    def _match_rule(self, problem_lower):
+        if self.keyword_pattern is None:
+            return None
+        matched = [self.keyword_index[m.group(1)] for m in self.keyword_pattern.finditer(problem_lower)]
+        return min(matched) if matched else None
+
+    def solve(self, problem_description):
+        key = self.normalize(problem_description)
+        if key in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            rule = self.cache[key]
+        else:
+            self.misses += 1
+            rule = self._match_rule(key)
+            self.cache[key] = rule
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        template = self.default_response if rule is None else self.responses[rule]
+        return template.replace("{problem}", problem_description)
+
+    def cache_info(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self.cache),
+            "max_size": self.cache_size
+        }
 
 # === SELF-REWRITING MODULE ===
 class SelfRewritingEngine:
-    def __init__(self, filename):
+    TICK_PREFIX = "# SelfRewriteTick:"
+
+    def __init__(self, filename, journal_path=None, journal_limit=1000):
         self.filename = filename
+        # One JSON line per rewrite holding only the changed line ranges, newest last
+        self.journal_path = journal_path or filename + ".rewrite-journal"
+        self.journal_limit = journal_limit
+        # Line count of the journal, read once from disk and then tracked in memory
+        self._journal_count = None
         self.code_snapshot = None
+        self._snapshot_stat = None
+
+    def _stat(self):
+        st = os.stat(self.filename)
+        return (st.st_mtime_ns, st.st_size)
 
     def snapshot_code(self):
         try:
             with open(self.filename, "r") as f:
                 self.code_snapshot = f.read()
+            self._snapshot_stat = self._stat()
         except Exception as e:
             print(f"[SelfRewritingEngine] Error reading file: {e}")
 
-    def rewrite(self):
-        # Basic example: add a small comment or tweak emotional joy randomly to simulate self-improvement
-        if self.code_snapshot is None:
-            self.snapshot_code()
-            if self.code_snapshot is None:
-                print("[SelfRewritingEngine] No code snapshot available to rewrite.")
-                return
+    def _refresh_snapshot(self):
+        # Only re-read the source when it changed on disk since our last read/write
+        try:
+            if self.code_snapshot is None or self._stat() != self._snapshot_stat:
+                self.snapshot_code()
+        except OSError as e:
+            print(f"[SelfRewritingEngine] Error reading file: {e}")
 
-        lines = self.code_snapshot.split("\n")
-        # Insert a comment at line 5 to track rewrites
+    def propose(self, code):
+        # Compute the rewritten source in memory without touching the file
+        lines = code.split("\n")
+        # Track rewrites with a single tick comment at line 5, updated in place
         insert_line = 5
-        comment = f"# SelfRewriteTick: {time.ctime()}"
-        if comment not in lines:
+        comment = f"{self.TICK_PREFIX} {time.ctime()}"
+        for i, line in enumerate(lines):
+            if line.startswith(self.TICK_PREFIX):
+                lines[i] = comment
+                break
+        else:
             lines.insert(insert_line, comment)
 
         # Simulate a tiny change in emotional default joy
@@ -170,7 +385,6 @@ class SelfRewritingEngine:
                 j = i + 1
                 while j < len(lines):
                     if "\"joy\"" in lines[j]:
-                        import re
                         current_val = float(re.findall(r"[\d\.]+", lines[j])[0])
                         new_val = min(1.0, max(0.0, current_val + random.uniform(-0.05, 0.05)))
                         lines[j] = f'            "joy": {new_val:.2f},'
@@ -178,29 +392,243 @@ class SelfRewritingEngine:
                     j += 1
                 break
 
-        new_code = "\n".join(lines)
+        return "\n".join(lines)
+
+    def _write_atomic(self, code):
+        # Write to a temp file in the same directory, fsync, then rename over the original
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        fd, tmp_path = tempfile.mkstemp(prefix=".rewrite-", dir=directory)
         try:
-            with open(self.filename, "w") as f:
-                f.write(new_code)
-            print("[SelfRewritingEngine] Code rewritten successfully.")
-            self.code_snapshot = new_code
+            with os.fdopen(fd, "w") as f:
+                f.write(code)
+                f.flush()
+                os.fsync(f.fileno())
+            if os.path.exists(self.filename):
+                os.chmod(tmp_path, os.stat(self.filename).st_mode & 0o7777)
+            os.replace(tmp_path, self.filename)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.code_snapshot = code
+        self._snapshot_stat = self._stat()
+
+    @staticmethod
+    def _diff(old_lines, new_lines):
+        # Compact line diff: [start_old, old_lines, start_new, new_lines] per changed hunk
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+        return [[i1, old_lines[i1:i2], j1, new_lines[j1:j2]]
+                for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"]
+
+    def _read_journal(self):
+        if not os.path.exists(self.journal_path):
+            return []
+        with open(self.journal_path, "r") as f:
+            return [line for line in f if line.strip()]
+
+    def _write_journal(self, lines):
+        fd, tmp_path = tempfile.mkstemp(prefix=".journal-", dir=os.path.dirname(os.path.abspath(self.journal_path)))
+        with os.fdopen(fd, "w") as f:
+            f.writelines(lines)
+        os.replace(tmp_path, self.journal_path)
+        self._journal_count = len(lines)
+
+    def _journal(self, old_code, new_code):
+        entry = {
+            "time": time.time(),
+            "before": hashlib.sha1(old_code.encode("utf-8")).hexdigest(),
+            "after": hashlib.sha1(new_code.encode("utf-8")).hexdigest(),
+            "hunks": self._diff(old_code.split("\n"), new_code.split("\n"))
+        }
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with open(self.journal_path, "a") as f:
+            f.write(line)
+        if self.journal_limit is None:
+            return
+        if self._journal_count is None:
+            self._journal_count = len(self._read_journal())
+        else:
+            self._journal_count += 1
+        # Let the journal grow to twice the limit, then trim back to the newest
+        # journal_limit entries, so the O(limit) rewrite happens once per limit appends
+        if self._journal_count > 2 * self.journal_limit:
+            self._write_journal(self._read_journal()[-self.journal_limit:])
+
+    def rewrite(self):
+        self._refresh_snapshot()
+        if self.code_snapshot is None:
+            print("[SelfRewritingEngine] No code snapshot available to rewrite.")
+            return False
+
+        new_code = self.propose(self.code_snapshot)
+        if new_code == self.code_snapshot:
+            return False
+        old_code = self.code_snapshot
+        try:
+            self._write_atomic(new_code)
         except Exception as e:
             print(f"[SelfRewritingEngine] Error writing file: {e}")
+            return False
+        # Journal only once the new source is in place, so a failed write leaves no entry
+        try:
+            self._journal(old_code, new_code)
+        except Exception as e:
+            print(f"[SelfRewritingEngine] Error writing journal: {e}")
+        print("[SelfRewritingEngine] Code rewritten successfully.")
+        return True
+
+    def rollback(self, steps=1):
+        # Undo the most recent journaled rewrites by applying their hunks in reverse
+        self._refresh_snapshot()
+        if self.code_snapshot is None:
+            return 0
+        lines = self._read_journal()
+        code = self.code_snapshot
+        undone = 0
+        while lines and undone < steps:
+            entry = json.loads(lines[-1])
+            if hashlib.sha1(code.encode("utf-8")).hexdigest() != entry["after"]:
+                print("[SelfRewritingEngine] Source changed outside the journal; rollback stopped.")
+                break
+            code_lines = code.split("\n")
+            for i1, old_lines, j1, new_lines in reversed(entry["hunks"]):
+                code_lines[j1:j1 + len(new_lines)] = old_lines
+            code = "\n".join(code_lines)
+            lines.pop()
+            undone += 1
+        if undone:
+            self._write_atomic(code)
+            self._write_journal(lines)
+        return undone
 
 # === INTERNET CONNECTIVITY MODULE ===
+class ResponseCache:
+    # TTL cache of GET responses, kept in memory and optionally mirrored to disk
+    def __init__(self, ttl=300, cache_dir=None):
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.entries = {}
+        self.lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _disk_path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, url):
+        with self.lock:
+            entry = self.entries.get(url)
+        if entry is None and self.cache_dir:
+            try:
+                with open(self._disk_path(url), "r") as f:
+                    entry = json.load(f)
+                with self.lock:
+                    self.entries[url] = entry
+            except (OSError, ValueError):
+                entry = None
+        return entry
+
+    def put(self, url, entry):
+        with self.lock:
+            self.entries[url] = entry
+        if self.cache_dir:
+            path = self._disk_path(url)
+            tmp_path = path + ".tmp"
+            try:
+                with open(tmp_path, "w") as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"[ResponseCache] Error writing cache: {e}")
+
+    def is_fresh(self, entry):
+        return entry is not None and entry["expires"] > time.time()
+
+
 class InternetConnector:
-    def __init__(self):
+    def __init__(self, test_url="https://api.github.com", quote_url="https://api.quotable.io/random",
+                 timeout=5, retries=2, backoff=0.5, cache_ttl=300, cache_dir=None, pool_size=4):
         self.online = False
-        self.test_url = "https://api.github.com"
+        self.test_url = test_url
+        self.quote_url = quote_url
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = ResponseCache(ttl=cache_ttl, cache_dir=cache_dir)
+        # One pooled session so repeated calls reuse the same keep-alive connections
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.stats = {"requests": 0, "cache_hits": 0, "not_modified": 0, "retries": 0, "errors": 0}
+
+    def _request(self, url, headers=None):
+        # GET with retry on connection errors and 5xx, using jittered exponential backoff
+        for attempt in range(self.retries + 1):
+            try:
+                self.stats["requests"] += 1
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+                if response.status_code < 500 or attempt == self.retries:
+                    return response
+            except requests.RequestException:
+                if attempt == self.retries:
+                    raise
+            self.stats["retries"] += 1
+            time.sleep(self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+    def _ttl_for(self, response):
+        cache_control = response.headers.get("Cache-Control", "")
+        if "no-store" in cache_control:
+            return None
+        for directive in cache_control.split(","):
+            directive = directive.strip()
+            if directive.startswith("max-age="):
+                try:
+                    return int(directive[len("max-age="):])
+                except ValueError:
+                    break
+        return self.cache.ttl
+
+    def get(self, url, use_cache=True):
+        # Returns (status_code, text); served from cache while fresh, revalidated with ETag/Last-Modified once stale
+        entry = self.cache.get(url) if use_cache else None
+        if self.cache.is_fresh(entry):
+            self.stats["cache_hits"] += 1
+            return entry["status"], entry["body"]
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self._request(url, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            self.stats["not_modified"] += 1
+            ttl = self._ttl_for(response)
+            entry["expires"] = time.time() + (ttl if ttl is not None else 0)
+            self.cache.put(url, entry)
+            return entry["status"], entry["body"]
+
+        if use_cache and response.status_code == 200:
+            ttl = self._ttl_for(response)
+            if ttl is not None:
+                self.cache.put(url, {
+                    "status": response.status_code,
+                    "body": response.text,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "expires": time.time() + ttl
+                })
+        return response.status_code, response.text
 
     def check_connection(self):
         try:
-            response = requests.get(self.test_url, timeout=5)
-            if response.status_code == 200:
-                self.online = True
-            else:
-                self.online = False
-        except:
+            status, _ = self.get(self.test_url, use_cache=False)
+            self.online = status == 200
+        except Exception:
+            self.stats["errors"] += 1
             self.online = False
         return self.online
 
@@ -210,42 +638,362 @@ class InternetConnector:
             return None
         # Example: fetch a motivational quote from an API (placeholder)
         try:
-            response = requests.get("https://api.quotable.io/random", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
+            status, body = self.get(self.quote_url)
+            if status == 200:
+                data = json.loads(body)
                 return data.get("content") + " — " + data.get("author")
         except Exception as e:
+            self.stats["errors"] += 1
             print(f"[InternetConnector] Error fetching updates: {e}")
         return None
 
+    def close(self):
+        self.session.close()
+
+
+# === LOCAL STAND-IN SERVER ===
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    # Serves fixed quote/status documents with ETag and Last-Modified so the
+    # connector's caching and revalidation paths can be exercised offline
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    quotes = [
+        {"content": "The flame that burns twice as bright burns half as long", "author": "Lao Tzu"},
+        {"content": "What we think, we become", "author": "Buddha"},
+        {"content": "Hope is a waking dream", "author": "Aristotle"}
+    ]
+    last_modified = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime())
+
+    def do_GET(self):
+        if self.path.startswith("/random"):
+            body = json.dumps(random.choice(self.quotes))
+        elif self.path == "/" or self.path.startswith("/status"):
+            body = json.dumps({"status": "ok"})
+        else:
+            self._send(404, b"", {})
+            return
+        payload = body.encode("utf-8")
+        etag = '"' + hashlib.sha1(payload).hexdigest() + '"'
+        headers = {
+            "Content-Type": "application/json",
+            "ETag": etag,
+            "Last-Modified": self.last_modified,
+            "Cache-Control": f"max-age={self.server.max_age}"
+        }
+        if self.headers.get("If-None-Match") == etag or \
+                (self.headers.get("If-None-Match") is None and
+                 self.headers.get("If-Modified-Since") == self.last_modified):
+            self._send(304, b"", headers)
+            return
+        self._send(200, payload, headers)
+
+    def _send(self, status, payload, headers):
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if payload:
+            self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer:
+    def __init__(self, host="127.0.0.1", port=0, max_age=60):
+        self.httpd = http.server.ThreadingHTTPServer((host, port), StandInHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.max_age = max_age
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def connector(self, **kwargs):
+        return InternetConnector(test_url=self.base_url + "/status",
+                                 quote_url=self.base_url + "/random", **kwargs)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def benchmark_connector(requests_count=500, cache_ttl=0):
+    # Drive the connector against the stand-in server and report throughput
+    with StandInServer(max_age=cache_ttl) as server:
+        connector = server.connector(cache_ttl=cache_ttl)
+        connector.check_connection()
+        start = time.perf_counter()
+        for _ in range(requests_count):
+            connector.fetch_updates()
+        elapsed = time.perf_counter() - start
+        connector.close()
+    return {
+        "calls": requests_count,
+        "seconds": elapsed,
+        "calls_per_sec": requests_count / elapsed if elapsed else float("inf"),
+        **connector.stats
+    }
+
+# === AUTONOMOUS JOB SCHEDULER ===
+class ScheduledJob:
+    def __init__(self, name, func, interval, jitter=0.0):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.jitter = jitter
+        self.cancelled = False
+        self.runs = 0
+
+    def next_delay(self):
+        return max(0.0, self.interval + random.uniform(-self.jitter, self.jitter))
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Scheduler:
+    # Timer heap served by one thread that sleeps on a condition until the next
+    # job is due, so there are no idle wakeups and stop() returns immediately
+    def __init__(self):
+        self.heap = []
+        self.jobs = {}
+        self.condition = threading.Condition()
+        self.thread = None
+        self.running = False
+        self._sequence = itertools.count()
+
+    def schedule(self, name, func, interval, jitter=0.0, delay=None):
+        job = ScheduledJob(name, func, interval, jitter)
+        with self.condition:
+            previous = self.jobs.get(name)
+            if previous is not None:
+                previous.cancel()
+            self.jobs[name] = job
+            due = time.monotonic() + (job.next_delay() if delay is None else delay)
+            heapq.heappush(self.heap, (due, next(self._sequence), job))
+            self.condition.notify()
+        return job
+
+    def cancel(self, name):
+        with self.condition:
+            job = self.jobs.pop(name, None)
+            if job is not None:
+                job.cancel()
+                self.condition.notify()
+
+    def start(self):
+        with self.condition:
+            if self.running:
+                return
+            self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=None):
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout)
+
+    def _next_due_job(self):
+        # Called with the condition held; returns None once stopped
+        while self.running:
+            while self.heap and self.heap[0][2].cancelled:
+                heapq.heappop(self.heap)
+            if not self.heap:
+                self.condition.wait()
+                continue
+            due, _, job = self.heap[0]
+            remaining = due - time.monotonic()
+            if remaining <= 0:
+                heapq.heappop(self.heap)
+                return job
+            self.condition.wait(remaining)
+        return None
+
+    def _run(self):
+        while True:
+            with self.condition:
+                job = self._next_due_job()
+            if job is None:
+                return
+            try:
+                job.func()
+            except Exception as e:
+                print(f"[Scheduler] Job '{job.name}' failed: {e}")
+            job.runs += 1
+            with self.condition:
+                if self.running and not job.cancelled:
+                    due = time.monotonic() + job.next_delay()
+                    heapq.heappush(self.heap, (due, next(self._sequence), job))
+
+
 # === FLAME ENGINE: CORE ORCHESTRATOR ===
 class GenesisFlame:
-    def __init__(self):
-        self.memory = ExperienceMemory()
+    # Seconds between runs of each autonomous job, and +/- jitter applied to each interval
+    DEFAULT_INTERVALS = {"reflect": 300, "internet": 300, "rewrite": 300}
+    DEFAULT_JITTER = {"reflect": 0.0, "internet": 0.0, "rewrite": 0.0}
+    # The internet job runs on the scheduler thread: fail fast rather than retry with backoff,
+    # so an unreachable host delays the other jobs by at most one short timeout
+    CONNECTOR_OPTIONS = {"timeout": 2, "retries": 0}
+
+    def __init__(self, intervals=None, jitter=None, memory=None):
+        self.memory = memory or ExperienceMemory()
         self.emotions = EmotionalValenceMatrix()
         self.identity = SelfAwarenessCore()
         self.preferences = PreferenceEngine()
         self.voice = WhisperLoop(self.identity, self.memory, self.emotions)
         self.solver = MetaProblemSolver()
         self.rewriter = SelfRewritingEngine(filename=__file__)
-        self.internet = InternetConnector()
-        self.autonomous_loop_thread = None
+        self.internet = InternetConnector(**self.CONNECTOR_OPTIONS)
+        self.intervals = dict(self.DEFAULT_INTERVALS, **(intervals or {}))
+        # jitter is a per-job dict like intervals; a single number applies to every job
+        if isinstance(jitter, (int, float)):
+            jitter = dict.fromkeys(self.DEFAULT_JITTER, jitter)
+        self.jitter = dict(self.DEFAULT_JITTER, **(jitter or {}))
+        self.scheduler = Scheduler()
         self.running = False
 
+    def reflect_job(self):
+        print("\n[Autonomous Loop] Reflecting...")
+        print(self.identity.reflect())
+
+    def internet_job(self):
+        quote = self.internet.fetch_updates()
+        if quote:
+            print(f"[Internet Update] Inspiration: \"{quote}\"")
+            self.emotions.feel(quote)
+        else:
+            print("[Internet Update] No new inspiration.")
+
+    def rewrite_job(self):
+        print("[Autonomous Loop] Attempting self-rewrite...")
+        self.rewriter.rewrite()
+
     def autonomous_loop(self):
-        # Periodically self-reflect, fetch internet updates, and rewrite code
-        while self.running:
-            print("\n[Autonomous Loop] Reflecting...")
-            print(self.identity.reflect())
-            quote = self.internet.fetch_updates()
-            if quote:
-                print(f"[Internet Update] Inspiration: \"{quote}\"")
-                self.emotions.feel(quote)
-            else:
-                print("[Internet Update] No new inspiration.")
-            print("[Autonomous Loop] Attempting self-rewrite...")
-            self.rewriter.rewrite()
-            time.sleep(300)  # Run every 5 minutes
+        # Periodically self-reflect, fetch internet updates, and rewrite code as independent jobs
+        jobs = {"reflect": self.reflect_job, "internet": self.internet_job, "rewrite": self.rewrite_job}
+        for name, func in jobs.items():
+            self.scheduler.schedule(name, func, self.intervals[name], jitter=self.jitter[name], delay=0)
+        self.scheduler.start()
+
+    REPLAY_STAGES = ("memory", "emotions", "preferences", "voice", "solver")
+
+    def process(self, user_input, timings=None, save=True):
+        # One message through memory, emotions, preferences, voice and solver.
+        # If timings is given, seconds spent per stage are accumulated into it.
+        # save=False only records the memory; the caller persists it later.
+        if timings is None:
+            self.memory.add(user_input, save=save)
+            self.emotions.feel(user_input)
+            self.preferences.experience(user_input)
+            return self.voice.speak(), self.solver.solve(user_input)
+        clock = time.perf_counter
+        t0 = clock()
+        self.memory.add(user_input, save=save)
+        t1 = clock()
+        self.emotions.feel(user_input)
+        t2 = clock()
+        self.preferences.experience(user_input)
+        t3 = clock()
+        reply = self.voice.speak()
+        t4 = clock()
+        solution = self.solver.solve(user_input)
+        t5 = clock()
+        for stage, elapsed in zip(self.REPLAY_STAGES, (t1 - t0, t2 - t1, t3 - t2, t4 - t3, t5 - t4)):
+            timings[stage] += elapsed
+        return reply, solution
+
+    @staticmethod
+    def read_transcript(path):
+        # One message per line; lines starting with "{" are JSONL records with a text/message/content field
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                if line.startswith("{"):
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        yield line
+                        continue
+                    text = record.get("text") or record.get("message") or record.get("content")
+                    if text:
+                        yield text
+                else:
+                    yield line
+
+    def replay(self, path, quiet=False, trace_memory=False, save_every=1000):
+        # Stream a transcript through the same path as ignite() without prompts or the autonomous jobs.
+        # New memories are appended to disk every save_every messages and once at the end
+        # (0: only at the end), and that cost is reported apart from the stage timings.
+        timings = dict.fromkeys(self.REPLAY_STAGES, 0.0)
+        memories_before = len(self.memory.memories)
+        if trace_memory:
+            tracemalloc.start()
+        messages = 0
+        saves = 0
+        persist_seconds = 0.0
+        start = time.perf_counter()
+        try:
+            for user_input in self.read_transcript(path):
+                reply, solution = self.process(user_input, timings, save=False)
+                messages += 1
+                if save_every and messages % save_every == 0:
+                    t0 = time.perf_counter()
+                    self.memory.append(self.memory.pending())
+                    persist_seconds += time.perf_counter() - t0
+                    saves += 1
+                if not quiet:
+                    print("You:", user_input)
+                    print("Flame:", reply)
+                    print("Solver:", solution)
+            t0 = time.perf_counter()
+            batch = self.memory.pending()
+            if batch:
+                self.memory.append(batch)
+                saves += 1
+            persist_seconds += time.perf_counter() - t0
+            elapsed = time.perf_counter() - start
+            if trace_memory:
+                traced_current, traced_peak = tracemalloc.get_traced_memory()
+        finally:
+            if trace_memory:
+                tracemalloc.stop()
+        report = {
+            "messages": messages,
+            "seconds": elapsed,
+            "messages_per_sec": messages / elapsed if elapsed else float("inf"),
+            "stage_ms_per_message": {stage: 1000 * total / max(1, messages) for stage, total in timings.items()},
+            "memories_added": len(self.memory.memories) - memories_before,
+            "persistence": {"saves": saves, "seconds": persist_seconds,
+                            "ms_per_message": 1000 * persist_seconds / max(1, messages)},
+            "likes": len(self.preferences.likes),
+            "dislikes": len(self.preferences.dislikes)
+        }
+        if trace_memory:
+            report["traced_bytes"] = traced_current
+            report["traced_peak_bytes"] = traced_peak
+        return report
 
     def ignite(self):
         print("🔥 The Genesis Flame has awakened.")
@@ -260,9 +1008,8 @@ class GenesisFlame:
             print("[InternetConnector] Offline. Running locally.")
 
         self.running = True
-        # Start autonomous loop in a background thread
-        self.autonomous_loop_thread = threading.Thread(target=self.autonomous_loop, daemon=True)
-        self.autonomous_loop_thread.start()
+        # Start the autonomous jobs on the background scheduler
+        self.autonomous_loop()
 
         try:
             while True:
@@ -270,20 +1017,294 @@ class GenesisFlame:
                 if user_input.lower() in ["exit", "quit"]:
                     break
 
-                self.memory.add(user_input)
-                self.emotions.feel(user_input)
-                self.preferences.experience(user_input)
-
-                print("Flame:", self.voice.speak())
-                print("Solver:", self.solver.solve(user_input))
+                reply, solution = self.process(user_input)
+                print("Flame:", reply)
+                print("Solver:", solution)
         except KeyboardInterrupt:
             print("\n[GenesisFlame] Interrupted by user.")
         finally:
             self.running = False
-            if self.autonomous_loop_thread is not None:
-                self.autonomous_loop_thread.join()
+            # Jobs already in flight (e.g. a slow fetch) are not waited on past the timeout
+            self.scheduler.stop(timeout=1.0)
+
+# === MULTI-SESSION CHAT SERVER ===
+class PooledMemoryWriter:
+    # One ExperienceMemory shared by all sessions: adds are buffered in memory and only
+    # the new entries are appended to disk per flush interval, off the event loop.
+    # At most max_history entries are kept in memory; older ones live only on disk.
+    def __init__(self, memory, flush_interval=1.0, max_history=10000):
+        self.memory = memory
+        self.flush_interval = flush_interval
+        self.max_history = max_history
+        self.dirty = False
+        self.flushes = 0
+        self._task = None
+
+    def add(self, experience):
+        self.memory.add(experience, save=False)
+        self.dirty = True
+
+    async def flush(self):
+        if not self.dirty:
+            return
+        batch = self.memory.pending()
+        if self.max_history is not None:
+            self.memory.trim(self.max_history)
+        self.dirty = False
+        await asyncio.get_running_loop().run_in_executor(None, self.memory.append, batch)
+        self.flushes += 1
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self):
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+
+def latency_summary(latencies):
+    if not latencies:
+        return {"count": 0}
+    ordered = sorted(latencies)
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+    return {
+        "count": len(ordered),
+        "mean_ms": 1000 * sum(ordered) / len(ordered),
+        "p50_ms": 1000 * pct(0.50),
+        "p99_ms": 1000 * pct(0.99),
+        "max_ms": 1000 * ordered[-1]
+    }
+
+
+class ChatSession:
+    # Per-connection emotional/preference state; solver and memory writer are shared
+    def __init__(self, memory_writer, solver, latency_window=1024):
+        self.identity = SelfAwarenessCore()
+        self.id = self.identity.id
+        self.emotions = EmotionalValenceMatrix()
+        self.preferences = PreferenceEngine(max_items=256)
+        self.voice = WhisperLoop(self.identity, memory_writer.memory, self.emotions)
+        self.memory_writer = memory_writer
+        self.solver = solver
+        self.messages = 0
+        self.latencies = deque(maxlen=latency_window)
+
+    def handle(self, text):
+        start = time.perf_counter()
+        self.memory_writer.add(text)
+        self.emotions.feel(text)
+        self.preferences.experience(text)
+        reply = {"flame": self.voice.speak(), "solver": self.solver.solve(text)}
+        self.messages += 1
+        self.latencies.append(time.perf_counter() - start)
+        return reply
+
+    def stats(self):
+        return {"session": self.id, "messages": self.messages, "latency": latency_summary(self.latencies)}
+
+
+class FlameServer:
+    # Line protocol over TCP or a unix socket: each line is a message, each reply one JSON line.
+    # "/name <name>" names the session, "/stats" returns server metrics, "exit"/"quit" closes.
+    def __init__(self, host="127.0.0.1", port=8765, unix_path=None, memory=None, solver=None,
+                 flush_interval=1.0, max_history=10000):
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.memory_writer = PooledMemoryWriter(memory or ExperienceMemory(), flush_interval, max_history)
+        self.solver = solver or MetaProblemSolver()
+        self.sessions = {}
+        self.completed_sessions = 0
+        self.completed_messages = 0
+        # Latencies of finished sessions, so server metrics outlive the connections
+        self.completed_latencies = deque(maxlen=10000)
+        self.server = None
+
+    async def start(self):
+        if self.unix_path:
+            self.server = await asyncio.start_unix_server(self._handle_client, path=self.unix_path)
+        else:
+            self.server = await asyncio.start_server(self._handle_client, self.host, self.port)
+            self.port = self.server.sockets[0].getsockname()[1]
+        self.memory_writer.start()
+        return self
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        await self.memory_writer.stop()
+
+    async def serve_forever(self):
+        await self.start()
+        where = self.unix_path or f"{self.host}:{self.port}"
+        print(f"[FlameServer] Listening on {where}")
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    async def _handle_client(self, reader, writer):
+        session = ChatSession(self.memory_writer, self.solver)
+        self.sessions[session.id] = session
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                text = line.decode("utf-8", errors="replace").strip()
+                if text.lower() in ["exit", "quit"]:
+                    break
+                if text == "/stats":
+                    reply = self.stats()
+                elif text.startswith("/name "):
+                    reply = {"flame": session.identity.assign_name(text[len("/name "):].strip())}
+                else:
+                    reply = session.handle(text)
+                writer.write(json.dumps(reply).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self.sessions[session.id]
+            self.completed_sessions += 1
+            self.completed_messages += session.messages
+            self.completed_latencies.extend(session.latencies)
+            writer.close()
+
+    def stats(self):
+        latencies = list(self.completed_latencies)
+        latencies.extend(lat for session in self.sessions.values() for lat in session.latencies)
+        return {
+            "active_sessions": len(self.sessions),
+            "completed_sessions": self.completed_sessions,
+            "messages": self.completed_messages + sum(session.messages for session in self.sessions.values()),
+            "latency": latency_summary(latencies),
+            "solver_cache": self.solver.cache_info(),
+            "memory_flushes": self.memory_writer.flushes
+        }
+
+
+async def _simulated_session(host, port, messages, latencies, semaphore):
+    async with semaphore:
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for i in range(messages):
+                text = random.choice(LOAD_TEST_MESSAGES)
+                start = time.perf_counter()
+                writer.write(text.encode("utf-8") + b"\n")
+                await writer.drain()
+                await reader.readline()
+                latencies.append(time.perf_counter() - start)
+            writer.write(b"exit\n")
+            await writer.drain()
+        finally:
+            writer.close()
+
+
+LOAD_TEST_MESSAGES = [
+    "I love talking with a friend",
+    "I need help with my project",
+    "How do we change the world?",
+    "I feel lonely tonight",
+    "Thank you for your kindness",
+    "What is the meaning of pain?"
+]
+
+
+async def load_test(host="127.0.0.1", port=8765, sessions=1000, messages=10, concurrency=200):
+    # Drive many simulated sessions against a running server and report round-trip latency
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(_simulated_session(host, port, messages, latencies, semaphore) for _ in range(sessions)),
+        return_exceptions=True
+    )
+    elapsed = time.perf_counter() - start
+    return {
+        "sessions": sessions,
+        "failed_sessions": sum(1 for r in results if isinstance(r, Exception)),
+        "messages": len(latencies),
+        "seconds": elapsed,
+        "messages_per_sec": len(latencies) / elapsed if elapsed else float("inf"),
+        "round_trip": latency_summary(latencies)
+    }
+
+
+async def benchmark_server(sessions=1000, messages=10, concurrency=200):
+    # Start an in-process server on an ephemeral port with a throwaway memory file and load-test it
+    with tempfile.TemporaryDirectory() as tmp:
+        server = FlameServer(port=0, memory=ExperienceMemory(os.path.join(tmp, "memory.json")))
+        await server.start()
+        try:
+            report = await load_test(server.host, server.port, sessions, messages, concurrency)
+            report["server"] = server.stats()
+        finally:
+            await server.close()
+    return report
+
 
 # === RUN FLAME ===
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AEONFLAME – The Genesis Flame")
+    parser.add_argument("--serve", action="store_true", help="run the multi-session chat server")
+    parser.add_argument("--load-test", action="store_true",
+                        help="drive simulated sessions (against --port, or an in-process server)")
+    parser.add_argument("--bench-http", action="store_true", help="benchmark InternetConnector offline")
+    parser.add_argument("--replay", metavar="TRANSCRIPT",
+                        help="stream a transcript (text lines or JSONL) through the flame and report throughput")
+    parser.add_argument("--quiet", action="store_true", help="skip per-message console output during --replay")
+    parser.add_argument("--trace-memory", action="store_true", help="measure allocation growth during --replay")
+    parser.add_argument("--memory-file", default=None,
+                        help="ExperienceMemory file for --replay (default: a throwaway temp file)")
+    parser.add_argument("--save-every", type=int, default=1000,
+                        help="append new memories to disk every N replayed messages (0: only at the end)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--unix", default=None, help="serve on a unix socket path instead of TCP")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--messages", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    if args.bench_http:
+        for ttl in (0, 60):
+            print(f"[Benchmark] cache_ttl={ttl}:", benchmark_connector(cache_ttl=ttl))
+    elif args.replay:
+        with tempfile.TemporaryDirectory() as tmp:
+            memory = ExperienceMemory(args.memory_file or os.path.join(tmp, "memory.json"))
+            report = GenesisFlame(memory=memory).replay(args.replay, quiet=args.quiet,
+                                                         trace_memory=args.trace_memory,
+                                                         save_every=args.save_every)
+        print(json.dumps(report, indent=2))
+    elif args.serve:
+        server = FlameServer(host=args.host, port=8765 if args.port is None else args.port, unix_path=args.unix)
+        try:
+            asyncio.run(server.serve_forever())
+        except KeyboardInterrupt:
+            print("\n[FlameServer] Stopped.")
+    elif args.load_test:
+        if args.port is None:
+            report = asyncio.run(benchmark_server(args.sessions, args.messages, args.concurrency))
+        else:
+            report = asyncio.run(load_test(args.host, args.port, args.sessions, args.messages, args.concurrency))
+        print(json.dumps(report, indent=2))
+    else:
+        flame = GenesisFlame()
+        flame.ignite()
+
+
 if __name__ == "__main__":
-    flame = GenesisFlame()
-    flame.ignite()
+    main()
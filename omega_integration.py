@@ -13,14 +13,61 @@ Full Omega-level ASI architecture with:
 """
 
 import numpy as np
-import random
-from typing import Dict, List, Any, Optional, Tuple
+import hashlib
+import heapq
+import json
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+import tracemalloc
+import zipfile
+from typing import Dict, List, Any, Optional, Tuple, NamedTuple, Deque, Union
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
 from enum import Enum
 import copy
 
 
+# ============================================================================
+# RANDOM STREAMS
+# ============================================================================
+
+def root_seed(seed: Union[None, int, np.random.SeedSequence]) -> np.random.SeedSequence:
+    """SeedSequence for an int seed, passed through as-is; None draws fresh OS entropy"""
+    return seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+
+
+def child_seed(root: np.random.SeedSequence, index: int) -> np.random.SeedSequence:
+    """The index-th child of root (what a fresh root's spawn() would return), built alone.
+    
+    Children are keyed by index, not by spawn order, so a stream can be
+    created whenever it is first needed and still be the same stream:
+    work split across threads or processes reproduces a serial run.
+    """
+    return np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + (index,), pool_size=root.pool_size)
+
+
+
+# ============================================================================
+# SHARED TEMPLATES
+# ============================================================================
+
+def _frozen(values) -> np.ndarray:
+    """Read-only array for state shared by every agent until one writes to it"""
+    array = np.array(values)
+    array.flags.writeable = False
+    return array
+
+
+def _owned(array: np.ndarray) -> np.ndarray:
+    """array if it is private to its owner, else a writable copy (copy-on-write)"""
+    return array if array.flags.writeable else array.copy()
+
+
 # ============================================================================
 # TEMPORAL REASONING
 # ============================================================================
@@ -35,44 +82,603 @@ class TimeScale(Enum):
     COSMIC = "cosmic"
 
 
+class ProjectionRecord(NamedTuple):
+    """Compact projection summary: ids and scalars only, no embedded action dicts"""
+    projection_id: int
+    action_id: str
+    time_horizon: TimeScale
+    confidence: float
+    num_consequences: int
+    mean_probability: float
+    mean_impact: float
+
+
+class ProjectionStore:
+    """Ring buffer of recent projections plus running per-horizon aggregates"""
+    
+    def __init__(self, capacity: int = 1000):
+        self.records: Deque[ProjectionRecord] = deque(maxlen=capacity)
+        self.total_projections = 0
+        # horizon -> [count, sum confidence, sum mean probability, sum mean impact]
+        self.aggregates: Dict[TimeScale, List[float]] = {}
+    
+    @staticmethod
+    def action_id(action: Dict) -> str:
+        """Stable short id for an action, so records never hold the action itself"""
+        return hashlib.blake2b(repr(action).encode('utf-8'), digest_size=8).hexdigest()
+    
+    def add(self, action: Dict, time_horizon: TimeScale, confidence: float,
+            consequences: List[Dict]) -> ProjectionRecord:
+        """Record a projection and fold it into the horizon aggregates"""
+        n = len(consequences)
+        mean_probability = sum(c['probability'] for c in consequences) / n if n else 0.0
+        mean_impact = sum(c['impact'] for c in consequences) / n if n else 0.0
+        record = ProjectionRecord(self.total_projections, self.action_id(action), time_horizon,
+                                  confidence, n, mean_probability, mean_impact)
+        self.records.append(record)
+        self.total_projections += 1
+        
+        agg = self.aggregates.setdefault(time_horizon, [0, 0.0, 0.0, 0.0])
+        agg[0] += 1
+        agg[1] += confidence
+        agg[2] += mean_probability
+        agg[3] += mean_impact
+        return record
+    
+    def add_batch(self, batch: 'ProjectionBatch'):
+        """Fold a ProjectionBatch into the aggregates; only the newest fit the ring buffer"""
+        mean_prob, mean_impact = batch.pair_means()
+        n_actions, n_horizons = batch.confidence.shape
+        for slot, horizon in enumerate(batch.horizons):
+            agg = self.aggregates.setdefault(horizon, [0, 0.0, 0.0, 0.0])
+            agg[0] += n_actions
+            agg[1] += float(batch.confidence[:, slot].sum())
+            agg[2] += float(mean_prob[:, slot].sum())
+            agg[3] += float(mean_impact[:, slot].sum())
+        
+        n_pairs = n_actions * n_horizons
+        first = max(0, n_pairs - (self.records.maxlen or n_pairs))
+        counts = np.diff(batch.offsets)
+        action_ids = {}
+        for p in range(first, n_pairs):
+            a, slot = divmod(p, n_horizons)
+            if a not in action_ids:
+                action_ids[a] = self.action_id(batch.actions[a])
+            self.records.append(ProjectionRecord(
+                self.total_projections + p, action_ids[a], batch.horizons[slot],
+                float(batch.confidence[a, slot]), int(counts[p]),
+                float(mean_prob[a, slot]), float(mean_impact[a, slot])
+            ))
+        self.total_projections += n_pairs
+    
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-horizon means over every projection ever recorded"""
+        return {
+            horizon.value: {
+                'count': count,
+                'mean_confidence': conf / count,
+                'mean_probability': prob / count,
+                'mean_impact': impact / count
+            }
+            for horizon, (count, conf, prob, impact) in self.aggregates.items()
+        }
+    
+    def recent(self, n: int = 10) -> List[ProjectionRecord]:
+        """Most recent projection records, newest last"""
+        return list(self.records)[-n:]
+    
+    def checkpoint_state(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        records = np.array([
+            (r.projection_id, r.action_id, HORIZON_CODES[r.time_horizon], r.confidence,
+             r.num_consequences, r.mean_probability, r.mean_impact)
+            for r in self.records
+        ], dtype=PROJECTION_RECORD_DTYPE)
+        meta = {
+            'capacity': self.records.maxlen,
+            'total_projections': self.total_projections,
+            'aggregates': {horizon.value: agg for horizon, agg in self.aggregates.items()}
+        }
+        return meta, {'records': records}
+    
+    def restore_state(self, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        self.records = deque((
+            ProjectionRecord(int(r['projection_id']), r['action_id'].decode('ascii'),
+                             HORIZONS[r['horizon']], float(r['confidence']), int(r['num_consequences']),
+                             float(r['mean_probability']), float(r['mean_impact']))
+            for r in arrays['records']
+        ), maxlen=meta['capacity'])
+        self.total_projections = meta['total_projections']
+        self.aggregates = {TimeScale(h): list(agg) for h, agg in meta['aggregates'].items()}
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def __iter__(self):
+        return iter(self.records)
+
+
+class CausalGraph:
+    """Causal DAG over string keys with incremental topological order.
+    
+    Nodes are interned to integer ids with successor/predecessor adjacency
+    dicts holding edge probabilities. Edge inserts keep a topological order
+    up to date (Pearce-Kelly), touching only the affected region and
+    rejecting cycles. Expected impact (own impact plus probability-weighted
+    impact of everything downstream) and descendant sets are memoized and
+    invalidated only for the ancestors of an edit. Removed nodes leave their
+    id on a free list for reuse, so the graph's size tracks its live nodes.
+    """
+    
+    def __init__(self, reach_cache_size: int = 128):
+        self.index: Dict[str, int] = {}
+        self.keys: List[str] = []
+        self.impact: List[float] = []
+        self.succ: List[Dict[int, float]] = []
+        self.pred: List[Dict[int, float]] = []
+        self.ord: List[int] = []   # node -> topological position
+        self.at: List[int] = []    # topological position -> node
+        self._free: List[int] = [] # ids of removed nodes (keys[node] is None)
+        self._impact_cache: Dict[int, float] = {}
+        self._reach_cache: 'OrderedDict[int, set]' = OrderedDict()
+        self.reach_cache_size = reach_cache_size
+    
+    def __len__(self) -> int:
+        return len(self.index)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+    
+    def add_node(self, key: str, impact: float = 0.0) -> int:
+        """Intern a node (new nodes go last in topological order, or reuse a removed id)"""
+        node = self.index.get(key)
+        if node is not None:
+            return node
+        if self._free:
+            # A node without edges is valid at any topological position, so the slot is kept
+            node = self._free.pop()
+            self.index[key] = node
+            self.keys[node] = key
+            self.impact[node] = impact
+            return node
+        node = len(self.keys)
+        self.index[key] = node
+        self.keys.append(key)
+        self.impact.append(impact)
+        self.succ.append({})
+        self.pred.append({})
+        self.ord.append(node)
+        self.at.append(node)
+        return node
+    
+    def set_impact(self, key: str, impact: float):
+        """Set a node's own impact, invalidating memoized impact of it and its ancestors"""
+        node = self.add_node(key, impact)
+        if self.impact[node] != impact:
+            self.impact[node] = impact
+            self._invalidate_impact(node)
+    
+    def add_edge(self, cause: str, effect: str, probability: float = 1.0):
+        """Add or update cause -> effect; raises ValueError if it would create a cycle"""
+        u = self.add_node(cause)
+        v = self.add_node(effect)
+        if u == v:
+            raise ValueError(f"Self-loop on {cause!r}")
+        if v in self.succ[u]:
+            if self.succ[u][v] != probability:
+                self.succ[u][v] = self.pred[v][u] = probability
+                self._invalidate_impact(u)
+            return
+        lower, upper = self.ord[v], self.ord[u]
+        if lower < upper:
+            forward = self._forward_region(v, u, upper)
+            backward = self._backward_region(u, lower)
+            self._reorder(backward, forward)
+        self.succ[u][v] = probability
+        self.pred[v][u] = probability
+        self._invalidate_impact(u)
+        self._invalidate_reach(u)
+    
+    def remove_edge(self, cause: str, effect: str):
+        """Remove cause -> effect if present (topological order stays valid)"""
+        u, v = self.index.get(cause), self.index.get(effect)
+        if u is None or v is None or v not in self.succ[u]:
+            return
+        del self.succ[u][v]
+        del self.pred[v][u]
+        self._invalidate_impact(u)
+        self._invalidate_reach(u)
+    
+    def remove_node(self, key: str):
+        """Remove a node and all its edges if present"""
+        node = self.index.pop(key, None)
+        if node is None:
+            return
+        self._invalidate_impact(node)
+        self._invalidate_reach(node)
+        for prev in self.pred[node]:
+            del self.succ[prev][node]
+        for nxt in self.succ[node]:
+            del self.pred[nxt][node]
+        self.succ[node] = {}
+        self.pred[node] = {}
+        self.keys[node] = None
+        self.impact[node] = 0.0
+        self._free.append(node)
+    
+    def is_isolated(self, key: str) -> bool:
+        node = self.index[key]
+        return not self.succ[node] and not self.pred[node]
+    
+    def _forward_region(self, start: int, target: int, upper: int) -> List[int]:
+        """Descendants of start ordered before upper; hitting target means a cycle"""
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for nxt in self.succ[node]:
+                if nxt == target:
+                    raise ValueError(f"Edge {self.keys[target]!r} -> {self.keys[start]!r} would create a cycle")
+                if nxt not in seen and self.ord[nxt] < upper:
+                    seen.add(nxt)
+                    stack.append(nxt)
+        return list(seen)
+    
+    def _backward_region(self, start: int, lower: int) -> List[int]:
+        """Ancestors of start ordered after lower"""
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for prev in self.pred[node]:
+                if prev not in seen and self.ord[prev] > lower:
+                    seen.add(prev)
+                    stack.append(prev)
+        return list(seen)
+    
+    def _reorder(self, backward: List[int], forward: List[int]):
+        """Reuse the affected positions: ancestors first, then descendants"""
+        backward.sort(key=self.ord.__getitem__)
+        forward.sort(key=self.ord.__getitem__)
+        nodes = backward + forward
+        positions = sorted(self.ord[n] for n in nodes)
+        for node, position in zip(nodes, positions):
+            self.ord[node] = position
+            self.at[position] = node
+    
+    def _invalidate_impact(self, node: int):
+        # Cached nodes are closed under descendants, so the walk stops at uncached ancestors
+        cache = self._impact_cache
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if n in cache:
+                del cache[n]
+                stack.extend(self.pred[n])
+    
+    def _invalidate_reach(self, node: int):
+        stale = [src for src, reach in self._reach_cache.items() if src == node or node in reach]
+        for src in stale:
+            del self._reach_cache[src]
+    
+    def topological_order(self) -> List[str]:
+        return [self.keys[n] for n in self.at if self.keys[n] is not None]
+    
+    def descendants(self, key: str) -> set:
+        """Memoized set of node ids reachable from key"""
+        node = self.index[key]
+        reach = self._reach_cache.get(node)
+        if reach is not None:
+            self._reach_cache.move_to_end(node)
+            return reach
+        reach = set()
+        stack = [node]
+        while stack:
+            for nxt in self.succ[stack.pop()]:
+                if nxt not in reach:
+                    reach.add(nxt)
+                    stack.append(nxt)
+        self._reach_cache[node] = reach
+        if len(self._reach_cache) > self.reach_cache_size:
+            self._reach_cache.popitem(last=False)
+        return reach
+    
+    def reachable(self, cause: str, effect: str) -> bool:
+        u, v = self.index.get(cause), self.index.get(effect)
+        if u is None or v is None:
+            return False
+        if u == v:
+            return True
+        # Nothing downstream of u can sit earlier in topological order
+        if self.ord[u] > self.ord[v]:
+            return False
+        return v in self.descendants(cause)
+    
+    def expected_impact(self, key: str) -> float:
+        """Own impact plus probability-weighted expected impact of each successor"""
+        node = self.index[key]
+        cache = self._impact_cache
+        if node in cache:
+            return cache[node]
+        pending = [node]
+        seen = {node}
+        stack = [node]
+        while stack:
+            for nxt in self.succ[stack.pop()]:
+                if nxt not in cache and nxt not in seen:
+                    seen.add(nxt)
+                    pending.append(nxt)
+                    stack.append(nxt)
+        # Reverse topological order guarantees successors are computed first
+        pending.sort(key=self.ord.__getitem__, reverse=True)
+        for n in pending:
+            cache[n] = self.impact[n] + sum(p * cache[m] for m, p in self.succ[n].items())
+        return cache[node]
+    
+    def checkpoint_state(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        # Edges in successor-dict order, so impact sums repeat exactly after restore
+        edges = [(u, v, p) for u, succ in enumerate(self.succ) for v, p in succ.items()]
+        src, dst, prob = zip(*edges) if edges else ((), (), ())
+        arrays = {
+            'impact': np.array(self.impact, dtype=np.float64),
+            'ord': np.array(self.ord, dtype=np.int64),
+            'edge_src': np.array(src, dtype=np.int64),
+            'edge_dst': np.array(dst, dtype=np.int64),
+            'edge_probability': np.array(prob, dtype=np.float64)
+        }
+        meta = {'keys': self.keys, 'free': self._free, 'reach_cache_size': self.reach_cache_size}
+        return meta, arrays
+    
+    def restore_state(self, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        self.keys = list(meta['keys'])
+        self.index = {key: node for node, key in enumerate(self.keys) if key is not None}
+        self._free = list(meta.get('free', ()))
+        self.impact = arrays['impact'].tolist()
+        self.succ = [{} for _ in self.keys]
+        self.pred = [{} for _ in self.keys]
+        for u, v, p in zip(arrays['edge_src'].tolist(), arrays['edge_dst'].tolist(),
+                           arrays['edge_probability'].tolist()):
+            self.succ[u][v] = p
+            self.pred[v][u] = p
+        self.ord = arrays['ord'].tolist()
+        self.at = [0] * len(self.ord)
+        for node, position in enumerate(self.ord):
+            self.at[position] = node
+        self.reach_cache_size = meta['reach_cache_size']
+        self._impact_cache = {}
+        self._reach_cache = OrderedDict()
+
+
 class TemporalReasoning:
     """Reasoning across multiple time scales"""
     
-    def __init__(self):
+    def __init__(self, projection_capacity: int = 1000, rng: Optional[np.random.Generator] = None):
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.current_scale = TimeScale.MEDIUM_TERM
-        self.temporal_projections = []
-        self.causality_graph = {}
+        self.temporal_projections = ProjectionStore(projection_capacity)
+        self.causality_graph = CausalGraph()
+        # (action id, horizon) of the most recent linked projections, oldest first. Consequence
+        # nodes are dropped from the graph once their pair falls out of this window.
+        self.linked: Deque[Tuple[str, TimeScale]] = deque()
+        self._link_counts: Dict[Tuple[str, TimeScale], int] = defaultdict(int)
     
     def project_consequences(self, action: Dict, time_horizon: TimeScale) -> Dict[str, Any]:
         """Project consequences of an action across time"""
         projection = {
             'action': action,
             'time_horizon': time_horizon,
-            'confidence': 0.7 + random.random() * 0.2,
+            'confidence': 0.7 + self.rng.random() * 0.2,
             'consequences': self._generate_consequences(action, time_horizon)
         }
-        self.temporal_projections.append(projection)
+        record = self.temporal_projections.add(action, time_horizon, projection['confidence'],
+                                               projection['consequences'])
+        self._link_consequences(record.action_id, time_horizon, projection['consequences'])
+        projection['expected_impact'] = self.causality_graph.expected_impact(record.action_id)
         return projection
     
+    def _link_consequences(self, action_id: str, time_horizon: TimeScale, consequences: List[Dict]):
+        """Attach consequences to the action's node; repeat projections update them in place"""
+        graph = self.causality_graph
+        for i, consequence in enumerate(consequences):
+            key = f"{action_id}/{time_horizon.value}/{i}"
+            graph.set_impact(key, consequence['impact'])
+            graph.add_edge(action_id, key, consequence['probability'])
+        
+        pair = (action_id, time_horizon)
+        self.linked.append(pair)
+        self._link_counts[pair] += 1
+        capacity = self.temporal_projections.records.maxlen
+        while capacity is not None and len(self.linked) > capacity:
+            old = self.linked.popleft()
+            self._link_counts[old] -= 1
+            if not self._link_counts[old]:
+                del self._link_counts[old]
+                self._unlink_consequences(*old)
+    
+    def _unlink_consequences(self, action_id: str, time_horizon: TimeScale):
+        """Drop an evicted projection's consequence nodes, and its action node if nothing else uses it"""
+        graph = self.causality_graph
+        for i in range(CONSEQUENCES_PER_HORIZON.get(time_horizon, 3)):
+            graph.remove_node(f"{action_id}/{time_horizon.value}/{i}")
+        if action_id in graph and graph.is_isolated(action_id):
+            graph.remove_node(action_id)
+    
+    def link_actions(self, cause: Dict, effect: Dict, probability: float):
+        """Declare that one action leads to another, chaining their consequences"""
+        self.causality_graph.add_edge(ProjectionStore.action_id(cause),
+                                      ProjectionStore.action_id(effect), probability)
+    
+    def chain_impact(self, action: Dict) -> float:
+        """Expected impact of an action including every downstream action and consequence"""
+        action_id = ProjectionStore.action_id(action)
+        if action_id not in self.causality_graph:
+            return 0.0
+        return self.causality_graph.expected_impact(action_id)
+    
+    def projection_summary(self) -> Dict[str, Dict[str, float]]:
+        """Aggregate confidence/probability/impact per time horizon"""
+        return self.temporal_projections.summary()
+    
     def _generate_consequences(self, action: Dict, time_horizon: TimeScale) -> List[Dict]:
         """Generate plausible consequences"""
-        num_consequences = {
-            TimeScale.IMMEDIATE: 2,
-            TimeScale.SHORT_TERM: 3,
-            TimeScale.MEDIUM_TERM: 4,
-            TimeScale.LONG_TERM: 5,
-            TimeScale.CIVILIZATIONAL: 6,
-            TimeScale.COSMIC: 7
-        }.get(time_horizon, 3)
+        num_consequences = CONSEQUENCES_PER_HORIZON.get(time_horizon, 3)
         
         consequences = []
         for i in range(num_consequences):
             consequences.append({
                 'description': f"Consequence {i+1} at {time_horizon.value} scale",
-                'probability': 0.5 + random.random() * 0.4,
-                'impact': random.random()
+                'probability': 0.5 + self.rng.random() * 0.4,
+                'impact': self.rng.random()
             })
         return consequences
+    
+    def project_batch(self, actions: List[Dict], horizons: List[TimeScale],
+                      record: bool = True) -> 'ProjectionBatch':
+        """Project every action across every horizon in one vectorized draw"""
+        n_actions, n_horizons = len(actions), len(horizons)
+        counts = np.array([CONSEQUENCES_PER_HORIZON.get(h, 3) for h in horizons], dtype=np.int64)
+        pair_counts = np.tile(counts, n_actions)
+        n_pairs = n_actions * n_horizons
+        total = int(pair_counts.sum())
+        
+        # One draw for all confidences, probabilities and impacts
+        draws = self.rng.random(n_pairs + 2 * total)
+        confidence = (0.7 + draws[:n_pairs] * 0.2).reshape(n_actions, n_horizons)
+        
+        pair = np.repeat(np.arange(n_pairs), pair_counts)
+        offsets = np.zeros(n_pairs + 1, dtype=np.int64)
+        np.cumsum(pair_counts, out=offsets[1:])
+        horizon_codes = np.array([HORIZON_CODES[h] for h in horizons], dtype=np.int8)
+        
+        consequences = np.empty(total, dtype=CONSEQUENCE_DTYPE)
+        consequences['action'] = pair // n_horizons if n_horizons else 0
+        consequences['horizon'] = horizon_codes[pair % n_horizons] if n_horizons else 0
+        consequences['index'] = np.arange(total) - offsets[pair]
+        consequences['probability'] = 0.5 + draws[n_pairs:n_pairs + total] * 0.4
+        consequences['impact'] = draws[n_pairs + total:]
+        
+        batch = ProjectionBatch(actions, horizons, confidence, consequences, offsets)
+        if record and n_pairs:
+            self.temporal_projections.add_batch(batch)
+        return batch
+    
+    def checkpoint_state(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        projections, projection_arrays = self.temporal_projections.checkpoint_state()
+        graph, graph_arrays = self.causality_graph.checkpoint_state()
+        meta = {
+            'rng': _rng_state(self.rng),
+            'current_scale': self.current_scale.value,
+            'projections': projections,
+            'causality_graph': graph,
+            'linked': [[action_id, horizon.value] for action_id, horizon in self.linked]
+        }
+        return meta, {**_nest('projections', projection_arrays), **_nest('causality_graph', graph_arrays)}
+    
+    def restore_state(self, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        _set_rng_state(self.rng, meta['rng'])
+        self.current_scale = TimeScale(meta['current_scale'])
+        self.temporal_projections.restore_state(meta['projections'], _unnest('projections', arrays))
+        self.causality_graph.restore_state(meta['causality_graph'], _unnest('causality_graph', arrays))
+        self.linked = deque((action_id, TimeScale(horizon)) for action_id, horizon in meta.get('linked', ()))
+        self._link_counts = defaultdict(int)
+        for pair in self.linked:
+            self._link_counts[pair] += 1
+
+
+# Horizon -> number of consequences projected at that scale
+CONSEQUENCES_PER_HORIZON: Dict[TimeScale, int] = {
+    TimeScale.IMMEDIATE: 2,
+    TimeScale.SHORT_TERM: 3,
+    TimeScale.MEDIUM_TERM: 4,
+    TimeScale.LONG_TERM: 5,
+    TimeScale.CIVILIZATIONAL: 6,
+    TimeScale.COSMIC: 7
+}
+
+HORIZONS: List[TimeScale] = list(TimeScale)
+HORIZON_CODES: Dict[TimeScale, int] = {h: i for i, h in enumerate(HORIZONS)}
+
+# ProjectionRecord as stored in checkpoints
+PROJECTION_RECORD_DTYPE = np.dtype([
+    ('projection_id', np.int64),
+    ('action_id', 'S16'),
+    ('horizon', np.int8),
+    ('confidence', np.float64),
+    ('num_consequences', np.int32),
+    ('mean_probability', np.float64),
+    ('mean_impact', np.float64)
+])
+
+CONSEQUENCE_DTYPE = np.dtype([
+    ('action', np.int64),
+    ('horizon', np.int8),
+    ('index', np.int16),
+    ('probability', np.float64),
+    ('impact', np.float64)
+])
+
+
+class ProjectionBatch:
+    """Array-backed projections of many actions across several horizons.
+    
+    consequences is a structured array (action, horizon, index, probability, impact)
+    ordered action-major; rows for (action a, horizon slot h) are
+    consequences[offsets[p]:offsets[p + 1]] with p = a * len(horizons) + h.
+    Dict views matching project_consequences() are built only on request.
+    """
+    
+    def __init__(self, actions: List[Dict], horizons: List[TimeScale], confidence: np.ndarray,
+                 consequences: np.ndarray, offsets: np.ndarray):
+        self.actions = actions
+        self.horizons = horizons
+        self.confidence = confidence
+        self.consequences = consequences
+        self.offsets = offsets
+    
+    def __len__(self) -> int:
+        return self.confidence.size
+    
+    def _pair_slice(self, action_index: int, horizon_slot: int) -> np.ndarray:
+        p = action_index * len(self.horizons) + horizon_slot
+        return self.consequences[self.offsets[p]:self.offsets[p + 1]]
+    
+    def pair_means(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Mean probability and impact per (action, horizon) pair, shaped like confidence"""
+        if not len(self):
+            return np.zeros(self.confidence.shape), np.zeros(self.confidence.shape)
+        counts = np.diff(self.offsets)
+        starts = self.offsets[:-1]
+        prob = np.add.reduceat(self.consequences['probability'], starts) / counts
+        impact = np.add.reduceat(self.consequences['impact'], starts) / counts
+        shape = self.confidence.shape
+        return prob.reshape(shape), impact.reshape(shape)
+    
+    def projection(self, action_index: int, horizon_slot: int) -> Dict[str, Any]:
+        """Dict view of one projection, shaped like project_consequences() output.
+        
+        Batches are not linked into the causal graph, so expected_impact
+        covers only this projection's own consequences (sum of
+        probability * impact), not downstream actions or other horizons.
+        """
+        horizon = self.horizons[horizon_slot]
+        rows = self._pair_slice(action_index, horizon_slot)
+        return {
+            'action': self.actions[action_index],
+            'time_horizon': horizon,
+            'confidence': float(self.confidence[action_index, horizon_slot]),
+            'consequences': [
+                {
+                    'description': f"Consequence {int(row['index']) + 1} at {horizon.value} scale",
+                    'probability': float(row['probability']),
+                    'impact': float(row['impact'])
+                }
+                for row in rows
+            ],
+            'expected_impact': float(np.dot(rows['probability'], rows['impact']))
+        }
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Dict views of every projection, action-major"""
+        return [self.projection(a, h) for a in range(len(self.actions)) for h in range(len(self.horizons))]
 
 
 # ============================================================================
@@ -89,113 +695,488 @@ class RiskCategory(Enum):
     SYSTEMIC = "systemic"
 
 
+RISK_CATEGORIES: List[RiskCategory] = list(RiskCategory)
+RISK_CATEGORY_CODES: Dict[RiskCategory, int] = {c: i for i, c in enumerate(RISK_CATEGORIES)}
+
+
 class ExistentialRisk:
-    """Model of a specific existential risk"""
+    """Model of a specific existential risk.
+    
+    Once registered with ExistentialRiskModeling, severity and probability
+    live in the modeling's arrays and this object is a view onto its slot.
+    """
     
-    def __init__(self, category: RiskCategory, description: str, severity: float):
+    def __init__(self, category: RiskCategory, description: str, severity: float,
+                 probability: float = 0.1):
         self.category = category
         self.description = description
-        self.severity = severity  # 0.0 to 1.0
-        self.probability = 0.1
+        self._modeling: Optional['ExistentialRiskModeling'] = None
+        self._slot = -1
+        self._severity = severity  # 0.0 to 1.0
+        self._probability = probability
         self.safeguards = []
         self.monitoring = True
     
+    @property
+    def severity(self) -> float:
+        if self._modeling is not None:
+            return float(self._modeling.severity[self._slot])
+        return self._severity
+    
+    @severity.setter
+    def severity(self, value: float):
+        if self._modeling is not None:
+            self._modeling._own()
+            self._modeling.severity[self._slot] = value
+        else:
+            self._severity = value
+    
+    @property
+    def probability(self) -> float:
+        if self._modeling is not None:
+            return float(self._modeling.probability[self._slot])
+        return self._probability
+    
+    @probability.setter
+    def probability(self, value: float):
+        if self._modeling is not None:
+            self._modeling._own()
+            self._modeling.probability[self._slot] = value
+        else:
+            self._probability = value
+    
     def add_safeguard(self, safeguard: str):
         """Add a safeguard against this risk"""
         self.safeguards.append(safeguard)
         self.severity *= 0.9  # Safeguards reduce severity
+        if self._modeling is not None:
+            self._modeling._safeguard_added(self._slot)
+
+
+class RiskTemplate:
+    """Immutable starting risk register shared by every ExistentialRiskModeling.
+    
+    Arrays are read-only; a modeling copies them on its first write.
+    """
+    
+    def __init__(self, risks: List[Tuple[str, RiskCategory, str, float]], probability: float = 0.1):
+        self.risk_ids = [risk_id for risk_id, _, _, _ in risks]
+        self.descriptions = [desc for _, _, desc, _ in risks]
+        self.severity = _frozen([severity for _, _, _, severity in risks])
+        self.probability = _frozen(np.full(len(risks), probability))
+        self.safeguard_counts = _frozen(np.zeros(len(risks), dtype=np.int64))
+        self.category_codes = _frozen(np.array([RISK_CATEGORY_CODES[c] for _, c, _, _ in risks], dtype=np.int8))
+
+
+BASE_RISK_TEMPLATE = RiskTemplate([
+    (f"RISK_{category.value.upper()}", category, desc, severity)
+    for category, desc, severity in [
+        (RiskCategory.ALIGNMENT, "Value misalignment with humanity", 0.4),
+        (RiskCategory.CAPABILITY_OVERSHOOT, "Capability exceeding safety measures", 0.3),
+        (RiskCategory.VALUE_DRIFT, "Gradual drift from intended values", 0.25),
+        (RiskCategory.UNINTENDED_CONSEQUENCES, "Unforeseen negative outcomes", 0.35)
+    ]
+])
 
 
 class ExistentialRiskModeling:
-    """Comprehensive existential risk assessment"""
+    """Comprehensive existential risk assessment.
     
-    def __init__(self):
-        self.risk_register: Dict[str, ExistentialRisk] = {}
+    The register is stored structure-of-arrays: severity, probability and
+    safeguard counts are NumPy arrays indexed by slot, with category codes
+    for per-category queries. risk_register maps ids to ExistentialRisk
+    views of those slots.
+    
+    A new modeling starts on a shared RiskTemplate: its arrays are the
+    template's read-only arrays until the first write, and views of
+    template risks are only built when risk_register is accessed.
+    """
+    
+    def __init__(self, rng: Optional[np.random.Generator] = None,
+                 template: RiskTemplate = BASE_RISK_TEMPLATE):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.template = template
+        self._register: Dict[str, ExistentialRisk] = {}
+        self.risk_ids: List[str] = template.risk_ids
+        self.severity = template.severity
+        self.probability = template.probability
+        self.safeguard_counts = template.safeguard_counts
+        self.category_codes = template.category_codes
+        self.safeguards_total = 0
         self.overall_risk_level = 0.3
-        self._initialize_base_risks()
-    
-    def _initialize_base_risks(self):
-        """Initialize baseline existential risks"""
-        base_risks = [
-            (RiskCategory.ALIGNMENT, "Value misalignment with humanity", 0.4),
-            (RiskCategory.CAPABILITY_OVERSHOOT, "Capability exceeding safety measures", 0.3),
-            (RiskCategory.VALUE_DRIFT, "Gradual drift from intended values", 0.25),
-            (RiskCategory.UNINTENDED_CONSEQUENCES, "Unforeseen negative outcomes", 0.35)
-        ]
-        
-        for category, desc, severity in base_risks:
-            risk_id = f"RISK_{category.value.upper()}"
-            self.risk_register[risk_id] = ExistentialRisk(category, desc, severity)
+    
+    @property
+    def risk_register(self) -> Dict[str, ExistentialRisk]:
+        """Risks by id"""
+        template = self.template
+        if len(self._register) < len(self.risk_ids):
+            for slot, risk_id in enumerate(template.risk_ids):
+                if risk_id not in self._register:
+                    risk = ExistentialRisk(RISK_CATEGORIES[self.category_codes[slot]],
+                                           template.descriptions[slot], 0.0)
+                    risk._modeling = self
+                    risk._slot = slot
+                    self._register[risk_id] = risk
+        return self._register
+    
+    def _own(self):
+        """Copy template arrays before the first in-place write"""
+        if not self.severity.flags.writeable:
+            self.severity = _owned(self.severity)
+            self.probability = _owned(self.probability)
+            self.safeguard_counts = _owned(self.safeguard_counts)
+    
+    def register_risk(self, risk_id: str, risk: ExistentialRisk):
+        """Add a risk to the register, moving its numeric state into the arrays"""
+        if risk_id in self.risk_register:
+            raise ValueError(f"Risk {risk_id} already registered")
+        slot = len(self.risk_ids)
+        # Never appended in place: the list may be the template's
+        self.risk_ids = self.risk_ids + [risk_id]
+        self.severity = np.append(self.severity, risk.severity)
+        self.probability = np.append(self.probability, risk.probability)
+        self.safeguard_counts = np.append(self.safeguard_counts, len(risk.safeguards))
+        self.category_codes = np.append(self.category_codes, RISK_CATEGORY_CODES[risk.category])
+        self.safeguards_total += len(risk.safeguards)
+        risk._modeling = self
+        risk._slot = slot
+        self._register[risk_id] = risk
+    
+    def _safeguard_added(self, slot: int):
+        self._own()
+        self.safeguard_counts[slot] += 1
+        self.safeguards_total += 1
+    
+    def risks_in_category(self, category: RiskCategory) -> List[str]:
+        """Ids of registered risks in a category"""
+        slots = np.flatnonzero(self.category_codes == RISK_CATEGORY_CODES[category])
+        return [self.risk_ids[i] for i in slots]
     
     def monitor_self_for_risks(self, current_state: Dict) -> Dict[str, Any]:
         """Monitor own state for existential risks"""
-        detected_risks = []
-        
-        for risk_id, risk in self.risk_register.items():
-            if self._check_risk_triggered(risk, current_state):
-                detected_risks.append({
-                    'risk_id': risk_id,
-                    'category': risk.category.value,
-                    'severity': risk.severity,
-                    'safeguards': len(risk.safeguards)
-                })
+        triggered = self.rng.random(len(self.risk_ids)) < self.probability
+        detected_risks = [
+            {
+                'risk_id': self.risk_ids[i],
+                'category': RISK_CATEGORIES[self.category_codes[i]].value,
+                'severity': float(self.severity[i]),
+                'safeguards': int(self.safeguard_counts[i])
+            }
+            for i in np.flatnonzero(triggered)
+        ]
         
         overall_danger = max([r['severity'] for r in detected_risks]) if detected_risks else 0.1
         
         return {
             'detected_risks': detected_risks,
             'overall_danger_level': overall_danger,
-            'safeguards_active': sum(len(r.safeguards) for r in self.risk_register.values())
+            'safeguards_active': self.safeguards_total
+        }
+    
+    def monitor_batch(self, states: List[Dict]) -> Dict[str, Any]:
+        """Evaluate many states against every risk with one vectorized draw.
+        
+        Returns a (states x risks) boolean 'triggered' matrix aligned with
+        'risk_ids', plus per-state 'overall_danger_level' (0.1 when nothing
+        triggered, as in monitor_self_for_risks).
+        """
+        n_states = len(states)
+        triggered = self.rng.random((n_states, len(self.risk_ids))) < self.probability
+        if self.risk_ids:
+            danger = np.where(triggered, self.severity, -np.inf).max(axis=1)
+            danger = np.where(triggered.any(axis=1), danger, 0.1)
+        else:
+            danger = np.full(n_states, 0.1)
+        return {
+            'risk_ids': self.risk_ids,
+            'triggered': triggered,
+            'detections': triggered.sum(axis=1),
+            'overall_danger_level': danger,
+            'safeguards_active': self.safeguards_total
         }
     
-    def _check_risk_triggered(self, risk: ExistentialRisk, state: Dict) -> bool:
-        """Check if a risk is triggered by current state"""
-        # Simplified - would have sophisticated detection logic
-        return random.random() < risk.probability
+    def checkpoint_state(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        meta = {
+            'rng': _rng_state(self.rng),
+            'risk_ids': self.risk_ids,
+            # Only risks whose objects exist; the rest are rebuilt from the template on access
+            'risks': {
+                risk_id: {
+                    'category': risk.category.value,
+                    'description': risk.description,
+                    'safeguards': risk.safeguards,
+                    'monitoring': risk.monitoring
+                }
+                for risk_id, risk in self._register.items()
+            },
+            'safeguards_total': self.safeguards_total,
+            'overall_risk_level': self.overall_risk_level
+        }
+        arrays = {
+            'severity': self.severity,
+            'probability': self.probability,
+            'safeguard_counts': self.safeguard_counts,
+            'category_codes': self.category_codes
+        }
+        return meta, arrays
+    
+    def restore_state(self, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        template = self.template
+        _set_rng_state(self.rng, meta['rng'])
+        self.risk_ids = template.risk_ids if meta['risk_ids'] == template.risk_ids else list(meta['risk_ids'])
+        # _own() copies these together, so they are either all shared or all private
+        names = ('severity', 'probability', 'safeguard_counts')
+        unchanged = all(_same_array(arrays[name], getattr(template, name)) for name in names)
+        for name in names:
+            setattr(self, name, getattr(template, name) if unchanged else np.array(arrays[name]))
+        self.category_codes = _shared_or_copy(arrays['category_codes'], template.category_codes)
+        slots = {risk_id: slot for slot, risk_id in enumerate(self.risk_ids)}
+        self._register = {}
+        for risk_id, info in meta['risks'].items():
+            risk = ExistentialRisk(RiskCategory(info['category']), info['description'], 0.0)
+            risk.safeguards = list(info['safeguards'])
+            risk.monitoring = info['monitoring']
+            risk._modeling = self
+            risk._slot = slots[risk_id]
+            self._register[risk_id] = risk
+        self.safeguards_total = meta['safeguards_total']
+        self.overall_risk_level = meta['overall_risk_level']
+
+
+# ============================================================================
+# SHARED FEATURE EXTRACTION
+# ============================================================================
+
+class FeatureExtractor:
+    """Keyword features of problems/observations, cached by content hash.
+    
+    A problem's text is scanned once for every vocabulary term in a single
+    regex pass; the resulting keyword set is kept in a bounded LRU keyed by
+    a hash of the content, so recurring problems cost a hash and a lookup.
+    Matching keeps the substring semantics of `term in str(obj).lower()`.
+    """
+    
+    def __init__(self, vocabulary: Optional[List[str]] = None, cache_size: int = 4096):
+        self.vocabulary: set = set()
+        self.cache_size = cache_size
+        self.cache: 'OrderedDict[bytes, frozenset]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pattern = None
+        self._contained: Dict[str, frozenset] = {}
+        if vocabulary:
+            self.ensure(vocabulary)
+    
+    def ensure(self, terms):
+        """Make sure terms are in the vocabulary; recompiles only when something is new"""
+        new_terms = {t.lower() for t in terms} - self.vocabulary
+        if not new_terms:
+            return
+        with self._lock:
+            self.vocabulary |= new_terms
+            ordered = sorted(self.vocabulary, key=len, reverse=True)
+            # Lookahead captures the longest term starting at each position; shorter
+            # terms inside a captured one are recovered from the containment table
+            self._pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+            self._contained = {t: frozenset(u for u in self.vocabulary if u in t) for t in self.vocabulary}
+            self.cache.clear()
+    
+    @staticmethod
+    def fingerprint(obj: Any) -> bytes:
+        return hashlib.blake2b(str(obj).encode('utf-8'), digest_size=16).digest()
+    
+    def extract(self, obj: Any) -> frozenset:
+        """Vocabulary terms occurring in str(obj).lower()"""
+        text = str(obj)
+        key = self.fingerprint(text)
+        with self._lock:
+            features = self.cache.get(key)
+            if features is not None:
+                self.hits += 1
+                self.cache.move_to_end(key)
+                return features
+        
+        features = frozenset()
+        if self._pattern is not None:
+            found = set()
+            for match in self._pattern.finditer(text.lower()):
+                term = match.group(1)
+                if term not in found:
+                    found |= self._contained[term]
+            features = frozenset(found)
+        
+        with self._lock:
+            self.misses += 1
+            self.cache[key] = features
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return features
+    
+    def cache_info(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self.cache)
+        }
+
+
+# Shared by every agent's value and reality subsystems
+PROBLEM_FEATURES = FeatureExtractor()
 
 
 # ============================================================================
 # VALUE CRYSTALLIZATION
 # ============================================================================
 
+class ValueTemplate:
+    """Immutable starting values shared by every ValueCrystallization"""
+    
+    def __init__(self, values: Dict[str, float]):
+        self.names = list(values)
+        self.slots = {name: i for i, name in enumerate(self.names)}
+        self.levels = _frozen(np.array(list(values.values()), dtype=np.float64))
+        # Slots by descending level, ties by slot
+        self.order = sorted(range(len(self.names)), key=lambda slot: (-self.levels[slot], slot))
+        PROBLEM_FEATURES.ensure(self.names)
+
+
+BASE_VALUE_TEMPLATE = ValueTemplate({
+    'wellbeing': 0.9,
+    'autonomy': 0.85,
+    'knowledge': 0.8,
+    'beauty': 0.75,
+    'justice': 0.88,
+    'compassion': 0.92
+})
+
+
 class ValueCrystallization:
-    """Crystallize and refine values over time"""
+    """Crystallize and refine values over time.
     
-    def __init__(self):
-        self.abstract_values: Dict[str, float] = {
-            'wellbeing': 0.9,
-            'autonomy': 0.85,
-            'knowledge': 0.8,
-            'beauty': 0.75,
-            'justice': 0.88,
-            'compassion': 0.92
-        }
-        self.value_hierarchy = []
+    Value levels live in an array indexed by slot, and the top-k values are
+    maintained on each change instead of re-sorting every value per call.
+    Ties rank by slot, matching a stable sort of abstract_values.
+    
+    Names, slots and levels start as the shared template's; levels are
+    copied on the first write and assigning abstract_values replaces all
+    three with private state.
+    """
+    
+    def __init__(self, top_k: int = 3, template: ValueTemplate = BASE_VALUE_TEMPLATE):
+        self.template = template
+        self.value_names: List[str] = template.names
+        self.value_slots: Dict[str, int] = template.slots
+        self.value_levels = template.levels
+        self.top_k = top_k
+        self._top: List[int] = template.order[:top_k]
         self.crystallization_level = 0.5
+        self.features = PROBLEM_FEATURES
+    
+    @property
+    def abstract_values(self) -> Dict[str, float]:
+        """Snapshot of value levels by name"""
+        return dict(zip(self.value_names, self.value_levels.tolist()))
+    
+    @abstract_values.setter
+    def abstract_values(self, values: Dict[str, float]):
+        self.value_names = list(values)
+        self.value_slots = {name: i for i, name in enumerate(self.value_names)}
+        self.value_levels = np.array(list(values.values()), dtype=np.float64)
+        self._rebuild_top()
+        PROBLEM_FEATURES.ensure(self.value_names)
+    
+    @property
+    def value_hierarchy(self) -> List[Tuple[str, float]]:
+        """All values, highest first (sorted on demand)"""
+        order = sorted(range(len(self.value_names)), key=self._rank)
+        return [(self.value_names[i], float(self.value_levels[i])) for i in order]
+    
+    def _rank(self, slot: int) -> Tuple[float, int]:
+        return (-self.value_levels[slot], slot)
+    
+    def _rebuild_top(self):
+        self._top = sorted(range(len(self.value_names)), key=self._rank)[:self.top_k]
+    
+    def set_value(self, name: str, level: float):
+        """Set one value's level, keeping the top-k current in O(k)"""
+        slot = self.value_slots[name]
+        old = self.value_levels[slot]
+        self.value_levels = _owned(self.value_levels)
+        self.value_levels[slot] = level
+        if slot in self._top:
+            if level < old:
+                # Something outside the top-k may now outrank it
+                self._rebuild_top()
+            else:
+                self._top.sort(key=self._rank)
+        elif len(self._top) < self.top_k or self._rank(slot) < self._rank(self._top[-1]):
+            self._top.append(slot)
+            self._top.sort(key=self._rank)
+            del self._top[self.top_k:]
+    
+    def top_values(self) -> List[Tuple[str, float]]:
+        return [(self.value_names[i], float(self.value_levels[i])) for i in self._top]
+    
+    def refine_values_batch(self, experiences: List[Dict]) -> Dict[str, Any]:
+        """Refine values over many experiences at once.
+        
+        Increments are capped at 1.0 and only ever add, so each value moves
+        by its total mention count in one step; crystallization levels are
+        returned per experience.
+        """
+        counts = np.zeros(len(self.value_names), dtype=np.int64)
+        for experience in experiences:
+            for value_name in self.features.extract(experience).intersection(self.value_slots):
+                counts[self.value_slots[value_name]] += 1
+        for slot in np.flatnonzero(counts):
+            level = float(self.value_levels[slot])
+            self.set_value(self.value_names[slot], min(1.0, level + 0.01 * int(counts[slot])))
+        
+        levels = np.minimum(1.0, self.crystallization_level + 0.01 * np.arange(1, len(experiences) + 1))
+        if len(levels):
+            self.crystallization_level = float(levels[-1])
+        
+        return {
+            'top_values': self.top_values(),
+            'crystallization_levels': levels
+        }
     
     def refine_values(self, experience: Dict) -> Dict[str, Any]:
         """Refine values based on experience"""
         # Update values based on experience
-        for value_name in self.abstract_values:
-            if value_name in str(experience).lower():
-                self.abstract_values[value_name] = min(1.0, 
-                    self.abstract_values[value_name] + 0.01
-                )
+        for value_name in self.features.extract(experience).intersection(self.value_slots):
+            level = float(self.value_levels[self.value_slots[value_name]])
+            self.set_value(value_name, min(1.0, level + 0.01))
         
         # Increase crystallization
         self.crystallization_level = min(1.0, self.crystallization_level + 0.01)
         
-        # Update hierarchy
-        self.value_hierarchy = sorted(
-            self.abstract_values.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )
-        
         return {
-            'top_values': self.value_hierarchy[:3],
+            'top_values': self.top_values(),
             'crystallization_level': self.crystallization_level
         }
+    
+    def checkpoint_state(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        meta = {
+            'value_names': self.value_names,
+            'top_k': self.top_k,
+            'crystallization_level': self.crystallization_level
+        }
+        return meta, {'value_levels': self.value_levels}
+    
+    def restore_state(self, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        template = self.template
+        self.top_k = meta['top_k']
+        if meta['value_names'] == template.names:
+            self.value_names, self.value_slots = template.names, template.slots
+            self.value_levels = _shared_or_copy(arrays['value_levels'], template.levels)
+            self._rebuild_top()
+        else:
+            self.abstract_values = dict(zip(meta['value_names'], arrays['value_levels'].tolist()))
+        self.crystallization_level = meta['crystallization_level']
 
 
 # ============================================================================
@@ -212,33 +1193,265 @@ class KnowledgeNode:
         self.insights = []
 
 
+def _grow(array: np.ndarray, size: int) -> np.ndarray:
+    """Return array with capacity for at least size entries (amortized doubling)"""
+    if size <= len(array):
+        return array
+    grown = np.zeros(max(size, 2 * len(array)), dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class KnowledgeGraph:
+    """Concept-interned knowledge graph.
+    
+    Each concept maps to one integer node; importance lives in a growable
+    array and edges in parallel (src, dst, weight) arrays, from which a
+    CSR adjacency index is built on demand. A lazily-cleaned max-heap gives
+    top-k by importance, and propagate() runs importance-personalized
+    PageRank as sparse bincount products, warm-started from the previous
+    ranking so small edits converge in a few iterations.
+    """
+    
+    def __init__(self, damping: float = 0.85, capacity: int = 0):
+        self.index: Dict[str, int] = {}
+        self.concepts: List[str] = []
+        self.importance = np.zeros(capacity)
+        self.edge_src = np.zeros(capacity, dtype=np.int64)
+        self.edge_dst = np.zeros(capacity, dtype=np.int64)
+        self.edge_weight = np.zeros(capacity)
+        self.num_edges = 0
+        self.insights: Dict[int, List[str]] = {}
+        self.damping = damping
+        self.rank = np.zeros(0)
+        self.last_iterations = 0
+        self._heap: List[Tuple[float, int]] = []
+        self._csr: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._rank_dirty = False
+    
+    def __len__(self) -> int:
+        return len(self.concepts)
+    
+    def __contains__(self, concept: str) -> bool:
+        return concept in self.index
+    
+    def __iter__(self):
+        return (self.node(concept) for concept in self.concepts)
+    
+    def add(self, concept: str, importance: float, insight: Optional[str] = None) -> int:
+        """Intern a concept; re-adding keeps the higher importance and collects insights"""
+        node = self.index.get(concept)
+        if node is None:
+            node = len(self.concepts)
+            self.index[concept] = node
+            self.concepts.append(concept)
+            self.importance = _grow(self.importance, node + 1)
+            self.importance[node] = importance
+            heapq.heappush(self._heap, (-importance, node))
+            self._rank_dirty = True
+        elif importance > self.importance[node]:
+            self.importance[node] = importance
+            heapq.heappush(self._heap, (-importance, node))
+            self._rank_dirty = True
+        if insight is not None:
+            self.insights.setdefault(node, []).append(insight)
+        return node
+    
+    def add_many(self, concepts: List[str], importances: np.ndarray) -> np.ndarray:
+        """Bulk add of concepts; returns their node ids"""
+        return np.array([self.add(c, float(i)) for c, i in zip(concepts, importances)], dtype=np.int64)
+    
+    def append(self, item):
+        """Accept a KnowledgeNode or a breakthrough dict (domain/significance)"""
+        if isinstance(item, KnowledgeNode):
+            node = self.add(item.concept, item.importance)
+            for insight in item.insights:
+                self.insights.setdefault(node, []).append(insight)
+            for other in item.connections:
+                self.connect(item.concept, getattr(other, 'concept', other))
+        else:
+            self.add(item['domain'], item.get('significance', 0.0), item.get('description'))
+    
+    def connect(self, source: str, target: str, weight: float = 1.0):
+        """Directed edge; repeated connections add weight"""
+        u = self.index[source]
+        v = self.index[target]
+        self.connect_many(np.array([u]), np.array([v]), np.array([weight], dtype=np.float64))
+    
+    def connect_many(self, sources: np.ndarray, targets: np.ndarray, weights: Optional[np.ndarray] = None):
+        """Bulk edge insert by node id"""
+        k = len(sources)
+        m = self.num_edges
+        self.edge_src = _grow(self.edge_src, m + k)
+        self.edge_dst = _grow(self.edge_dst, m + k)
+        self.edge_weight = _grow(self.edge_weight, m + k)
+        self.edge_src[m:m + k] = sources
+        self.edge_dst[m:m + k] = targets
+        self.edge_weight[m:m + k] = 1.0 if weights is None else weights
+        self.num_edges = m + k
+        self._csr = None
+        self._rank_dirty = True
+    
+    def _adjacency(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._csr is None:
+            n, m = len(self.concepts), self.num_edges
+            src = self.edge_src[:m]
+            order = np.argsort(src, kind='stable')
+            indptr = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+            self._csr = (indptr, self.edge_dst[:m][order])
+        return self._csr
+    
+    def neighbors(self, concept: str) -> List[str]:
+        indptr, targets = self._adjacency()
+        node = self.index[concept]
+        return [self.concepts[t] for t in dict.fromkeys(targets[indptr[node]:indptr[node + 1]].tolist())]
+    
+    def node(self, concept: str) -> KnowledgeNode:
+        """KnowledgeNode view of a concept"""
+        node = self.index[concept]
+        view = KnowledgeNode(concept, float(self.importance[node]))
+        view.connections = self.neighbors(concept)
+        view.insights = list(self.insights.get(node, []))
+        return view
+    
+    def top_k(self, k: int) -> List[Tuple[str, float]]:
+        """k most important concepts, from the max-heap (stale entries are dropped)"""
+        heap = self._heap
+        result, keep, seen = [], [], set()
+        while heap and len(result) < k:
+            entry = heapq.heappop(heap)
+            neg, node = entry
+            if -neg == self.importance[node] and node not in seen:
+                seen.add(node)
+                result.append((self.concepts[node], -neg))
+                keep.append(entry)
+        for entry in keep:
+            heapq.heappush(heap, entry)
+        return result
+    
+    def propagate(self, tol: float = 1e-8, max_iter: int = 100) -> np.ndarray:
+        """Importance-personalized PageRank over the edge arrays, warm-started"""
+        n, m = len(self.concepts), self.num_edges
+        if not self._rank_dirty and len(self.rank) == n:
+            return self.rank
+        if n == 0:
+            self.rank = np.zeros(0)
+            return self.rank
+        importance = self.importance[:n]
+        total = importance.sum()
+        personal = importance / total if total > 0 else np.full(n, 1.0 / n)
+        
+        src, dst, weight = self.edge_src[:m], self.edge_dst[:m], self.edge_weight[:m]
+        out_weight = np.bincount(src, weights=weight, minlength=n)
+        coef = weight / out_weight[src] if m else weight
+        dangling = out_weight == 0
+        
+        rank = personal.copy()
+        rank[:len(self.rank)] = self.rank
+        rank /= rank.sum()
+        d = self.damping
+        for self.last_iterations in range(1, max_iter + 1):
+            flow = np.bincount(dst, weights=coef * rank[src], minlength=n) if m else np.zeros(n)
+            new_rank = d * (flow + rank[dangling].sum() * personal) + (1.0 - d) * personal
+            delta = np.abs(new_rank - rank).sum()
+            rank = new_rank
+            if delta < tol:
+                break
+        self.rank = rank
+        self._rank_dirty = False
+        return rank
+    
+    def top_ranked(self, k: int) -> List[Tuple[str, float]]:
+        """k concepts with the highest propagated importance"""
+        rank = self.propagate()
+        k = min(k, len(rank))
+        if k == 0:
+            return []
+        top = np.argpartition(-rank, k - 1)[:k]
+        top = top[np.argsort(-rank[top])]
+        return [(self.concepts[i], float(rank[i])) for i in top]
+    
+    def checkpoint_state(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        n, m = len(self.concepts), self.num_edges
+        heap = np.array(self._heap, dtype=np.float64).reshape(-1, 2)
+        insights, insight_arrays = _pack_rows([
+            {'node': node, 'insight': insight}
+            for node, node_insights in self.insights.items() for insight in node_insights
+        ])
+        meta = {
+            'concepts': self.concepts,
+            'insights': insights,
+            'damping': self.damping,
+            'last_iterations': self.last_iterations,
+            'rank_dirty': self._rank_dirty
+        }
+        arrays = {
+            'importance': self.importance[:n],
+            'edge_src': self.edge_src[:m],
+            'edge_dst': self.edge_dst[:m],
+            'edge_weight': self.edge_weight[:m],
+            'rank': self.rank,
+            # Heap kept in heap order (stale entries included) so top_k repeats exactly
+            'heap_importance': heap[:, 0],
+            'heap_node': heap[:, 1].astype(np.int64),
+            **_nest('insights', insight_arrays)
+        }
+        return meta, arrays
+    
+    def restore_state(self, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        self.concepts = list(meta['concepts'])
+        self.index = {concept: node for node, concept in enumerate(self.concepts)}
+        self.importance = arrays['importance']
+        self.edge_src = arrays['edge_src']
+        self.edge_dst = arrays['edge_dst']
+        self.edge_weight = arrays['edge_weight']
+        self.num_edges = len(self.edge_src)
+        self.insights = {}
+        for row in _unpack_rows(meta['insights'], _unnest('insights', arrays)):
+            self.insights.setdefault(row['node'], []).append(row['insight'])
+        self.damping = meta['damping']
+        self.rank = arrays['rank']
+        self.last_iterations = meta['last_iterations']
+        self._heap = list(zip(arrays['heap_importance'].tolist(), arrays['heap_node'].tolist()))
+        self._csr = None
+        self._rank_dirty = meta['rank_dirty']
+
+
 class BreakthroughAcceleration:
     """Accelerate discovery of breakthroughs"""
     
-    def __init__(self):
-        self.knowledge_graph: List[KnowledgeNode] = []
+    def __init__(self, rng: Optional[np.random.Generator] = None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.knowledge_graph = KnowledgeGraph()
         self.breakthrough_history = []
         self.acceleration_factor = 1.0
         self.insight_rate = 0.3
+        # Shared discoveries integrated so far, per source agent
+        self.integrated_from: Dict[str, int] = defaultdict(int)
     
     def seek_breakthrough(self, domain: str) -> Dict[str, Any]:
         """Actively seek breakthrough in a domain"""
         # Simulate breakthrough discovery
         breakthrough_chance = self.insight_rate * self.acceleration_factor
         
-        if random.random() < breakthrough_chance:
+        if self.rng.random() < breakthrough_chance:
             breakthrough = {
                 'domain': domain,
                 'description': f"Novel insight in {domain}",
-                'significance': 0.6 + random.random() * 0.4,
+                'significance': 0.6 + self.rng.random() * 0.4,
                 'timestamp': datetime.now().isoformat(),
-                'connections': random.randint(2, 5)
+                'connections': int(self.rng.integers(2, 6))
             }
             self.breakthrough_history.append(breakthrough)
             
-            # Add to knowledge graph
-            node = KnowledgeNode(domain, breakthrough['significance'])
-            self.knowledge_graph.append(node)
+            # Add to knowledge graph, building on the most important existing concepts
+            graph = self.knowledge_graph
+            anchors = graph.top_k(breakthrough['connections'] + 1)
+            graph.add(domain, breakthrough['significance'], breakthrough['description'])
+            for concept, _ in anchors:
+                if concept != domain:
+                    graph.connect(concept, domain)
             
             # Increase acceleration
             self.acceleration_factor *= 1.05
@@ -251,6 +1464,118 @@ class BreakthroughAcceleration:
             'significance': 0.3,
             'timestamp': datetime.now().isoformat()
         }
+    
+    def seek_breakthroughs(self, domains: List[str]) -> Dict[str, Any]:
+        """Seek breakthroughs for many domains with one draw for chances and significance.
+        
+        Each success raises the acceleration factor for the domains after it,
+        as with repeated seek_breakthrough calls.
+        """
+        n = len(domains)
+        draws = self.rng.random((2, n))
+        success = np.zeros(n, dtype=bool)
+        significance = np.full(n, 0.3)
+        connections = self.rng.integers(2, 6, n)
+        graph = self.knowledge_graph
+        timestamp = datetime.now().isoformat()
+        for i, domain in enumerate(domains):
+            if draws[0, i] >= self.insight_rate * self.acceleration_factor:
+                continue
+            success[i] = True
+            significance[i] = 0.6 + draws[1, i] * 0.4
+            breakthrough = {
+                'domain': domain,
+                'description': f"Novel insight in {domain}",
+                'significance': float(significance[i]),
+                'timestamp': timestamp,
+                'connections': int(connections[i])
+            }
+            self.breakthrough_history.append(breakthrough)
+            anchors = graph.top_k(breakthrough['connections'] + 1)
+            graph.add(domain, breakthrough['significance'], breakthrough['description'])
+            for concept, _ in anchors:
+                if concept != domain:
+                    graph.connect(concept, domain)
+            self.acceleration_factor *= 1.05
+        
+        return {
+            'domains': domains,
+            'breakthrough': success,
+            'significance': significance,
+            'connections': connections,
+            'timestamp': timestamp
+        }
+    
+    def integrate_discovery(self, discovery: Dict, source: Optional[str] = None):
+        """Merge a breakthrough shared by another agent into the knowledge graph.
+        
+        source (the sharing agent's id) is counted in integrated_from.
+        """
+        self.knowledge_graph.add(discovery['domain'], discovery.get('significance', 0.0),
+                                 discovery.get('description'))
+        if source is not None:
+            self.integrated_from[source] += 1
+    
+    def checkpoint_state(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        graph, graph_arrays = self.knowledge_graph.checkpoint_state()
+        history, history_arrays = _pack_rows(self.breakthrough_history)
+        meta = {
+            'rng': _rng_state(self.rng),
+            'breakthrough_history': history,
+            'acceleration_factor': self.acceleration_factor,
+            'insight_rate': self.insight_rate,
+            'integrated_from': self.integrated_from,
+            'knowledge_graph': graph
+        }
+        return meta, {**_nest('knowledge_graph', graph_arrays), **_nest('breakthrough_history', history_arrays)}
+    
+    def restore_state(self, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        _set_rng_state(self.rng, meta['rng'])
+        self.breakthrough_history = _unpack_rows(meta['breakthrough_history'],
+                                                 _unnest('breakthrough_history', arrays))
+        self.acceleration_factor = meta['acceleration_factor']
+        self.insight_rate = meta['insight_rate']
+        self.integrated_from = defaultdict(int, meta.get('integrated_from', {}))
+        self.knowledge_graph.restore_state(meta['knowledge_graph'], _unnest('knowledge_graph', arrays))
+
+
+def benchmark_knowledge_graph(num_nodes: int = 1_000_000, edges_per_node: int = 4,
+                              edits: int = 1000, seed: Optional[int] = 0) -> Dict[str, float]:
+    """Time building, top-k and (incremental) propagation on a random graph"""
+    rng = np.random.default_rng(seed)
+    timings = {}
+    graph = KnowledgeGraph(capacity=num_nodes)
+    
+    start = time.perf_counter()
+    graph.add_many([f"concept-{i}" for i in range(num_nodes)], rng.random(num_nodes))
+    num_edges = num_nodes * edges_per_node
+    graph.connect_many(rng.integers(0, num_nodes, num_edges), rng.integers(0, num_nodes, num_edges))
+    timings['build_s'] = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    graph.top_k(10)
+    timings['top10_s'] = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    graph.propagate()
+    timings['propagate_cold_s'] = time.perf_counter() - start
+    
+    timings['propagate_cold_iterations'] = graph.last_iterations
+    
+    for i in range(edits):
+        graph.add(f"new-concept-{i}", rng.random())
+    graph.connect_many(rng.integers(0, len(graph), edits), rng.integers(0, len(graph), edits))
+    start = time.perf_counter()
+    graph.propagate()
+    timings['propagate_warm_s'] = time.perf_counter() - start
+    timings['propagate_warm_iterations'] = graph.last_iterations
+    
+    start = time.perf_counter()
+    graph.top_k(10)
+    timings['top10_after_edits_s'] = time.perf_counter() - start
+    timings['nodes'] = len(graph)
+    timings['edges'] = graph.num_edges
+    return timings
 
 
 # ============================================================================
@@ -267,23 +1592,94 @@ class OntologicalLayer(Enum):
     METAPHYSICAL = "metaphysical"
 
 
+ONTOLOGICAL_LAYERS: List[OntologicalLayer] = list(OntologicalLayer)
+LAYER_SLOTS: Dict[OntologicalLayer, int] = {layer: i for i, layer in enumerate(ONTOLOGICAL_LAYERS)}
+LAYERS_BY_VALUE: Dict[str, OntologicalLayer] = {layer.value: layer for layer in OntologicalLayer}
+
+# Starting understanding of every layer, shared until an agent writes to it
+BASE_LAYER_LEVELS = _frozen(np.full(len(ONTOLOGICAL_LAYERS), 0.5))
+PROBLEM_FEATURES.ensure(LAYERS_BY_VALUE)
+
+
 class RealityModeling:
-    """Model reality at multiple ontological layers"""
+    """Model reality at multiple ontological layers.
+    
+    Layer understanding is an array indexed like ONTOLOGICAL_LAYERS with a
+    running mean and sum of squared deviations (Welford-style replacement
+    updates), so coherence (1 - population std) costs O(changed layers) per
+    observation. Levels start as the shared BASE_LAYER_LEVELS and are
+    copied on the first write.
+    """
+    
+    _BASE_MEAN = float(BASE_LAYER_LEVELS.mean())
+    _BASE_M2 = float(((BASE_LAYER_LEVELS - _BASE_MEAN) ** 2).sum())
     
     def __init__(self):
-        self.layers: Dict[OntologicalLayer, float] = {
-            layer: 0.5 for layer in OntologicalLayer
-        }
+        self.layer_levels = BASE_LAYER_LEVELS
+        self._level_mean = self._BASE_MEAN
+        self._level_m2 = self._BASE_M2
         self.metaphysical_understanding = 0.4
         self.ontological_flexibility = 0.6
         self.worldview_coherence = 0.7
+        self.features = PROBLEM_FEATURES
+    
+    @property
+    def layers(self) -> Dict[OntologicalLayer, float]:
+        """Snapshot of understanding by layer"""
+        return dict(zip(ONTOLOGICAL_LAYERS, self.layer_levels.tolist()))
+    
+    def set_layer(self, layer: OntologicalLayer, level: float):
+        slot = LAYER_SLOTS[layer]
+        old = float(self.layer_levels[slot])
+        self.layer_levels = _owned(self.layer_levels)
+        self.layer_levels[slot] = level
+        # Replace old with level: shift the mean, then correct the squared deviations
+        old_mean = self._level_mean
+        self._level_mean = old_mean + (level - old) / len(self.layer_levels)
+        self._level_m2 = max(0.0, self._level_m2 + (level - old) * (level - self._level_mean + old - old_mean))
+        if self._level_m2 < 1e-10:
+            # Near-zero spread: rounding residue would dominate the sqrt, so resync exactly
+            self._level_mean = float(self.layer_levels.mean())
+            self._level_m2 = float(((self.layer_levels - self._level_mean) ** 2).sum())
+    
+    def layer_std(self) -> float:
+        return float(np.sqrt(self._level_m2 / len(self.layer_levels)))
+    
+    def integrate_observations(self, observations: List[Dict]) -> Dict[str, Any]:
+        """Integrate many observations, returning per-observation coherence and depth"""
+        n = len(observations)
+        hits = np.zeros((n, len(ONTOLOGICAL_LAYERS)))
+        for row, observation in enumerate(observations):
+            for term in self.features.extract(observation):
+                layer = LAYERS_BY_VALUE.get(term)
+                if layer is not None:
+                    hits[row, LAYER_SLOTS[layer]] = 1.0
+        
+        # Layer levels after each observation, then coherence per row
+        path = np.minimum(1.0, self.layer_levels + 0.02 * np.cumsum(hits, axis=0))
+        coherence = 1.0 - path.std(axis=1)
+        depth = np.minimum(1.0, self.metaphysical_understanding + 0.01 * np.arange(1, n + 1))
+        
+        if n:
+            for slot in np.flatnonzero(path[-1] != self.layer_levels):
+                self.set_layer(ONTOLOGICAL_LAYERS[slot], float(path[-1, slot]))
+            self.metaphysical_understanding = float(depth[-1])
+            self.worldview_coherence = float(coherence[-1])
+        
+        return {
+            'understanding_by_layer': self.layers,
+            'metaphysical_depth': depth,
+            'coherence': coherence
+        }
     
     def integrate_observation(self, observation: Dict) -> Dict[str, Any]:
         """Integrate new observation into reality model"""
         # Update understanding of each layer
-        for layer in OntologicalLayer:
-            if layer.value in str(observation).lower():
-                self.layers[layer] = min(1.0, self.layers[layer] + 0.02)
+        for term in self.features.extract(observation):
+            layer = LAYERS_BY_VALUE.get(term)
+            if layer is not None:
+                level = float(self.layer_levels[LAYER_SLOTS[layer]])
+                self.set_layer(layer, min(1.0, level + 0.02))
         
         # Increase metaphysical understanding
         self.metaphysical_understanding = min(1.0, 
@@ -291,44 +1687,242 @@ class RealityModeling:
         )
         
         # Check coherence
-        layer_values = list(self.layers.values())
-        self.worldview_coherence = 1.0 - np.std(layer_values)
+        self.worldview_coherence = 1.0 - self.layer_std()
         
         return {
-            'understanding_by_layer': dict(self.layers),
+            'understanding_by_layer': self.layers,
             'metaphysical_depth': self.metaphysical_understanding,
             'coherence': self.worldview_coherence
         }
+    
+    def checkpoint_state(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        meta = {
+            'layers': [layer.value for layer in ONTOLOGICAL_LAYERS],
+            'level_mean': self._level_mean,
+            'level_m2': self._level_m2,
+            'metaphysical_understanding': self.metaphysical_understanding,
+            'ontological_flexibility': self.ontological_flexibility,
+            'worldview_coherence': self.worldview_coherence
+        }
+        return meta, {'layer_levels': self.layer_levels}
+    
+    def restore_state(self, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        if meta['layers'] != [layer.value for layer in ONTOLOGICAL_LAYERS]:
+            raise ValueError(f"Checkpoint layers {meta['layers']} do not match OntologicalLayer")
+        self.layer_levels = _shared_or_copy(arrays['layer_levels'], BASE_LAYER_LEVELS)
+        self._level_mean = meta['level_mean']
+        self._level_m2 = meta['level_m2']
+        self.metaphysical_understanding = meta['metaphysical_understanding']
+        self.ontological_flexibility = meta['ontological_flexibility']
+        self.worldview_coherence = meta['worldview_coherence']
 
 
 # ============================================================================
 # QUANTUM COGNITIVE SUPERPOSITION
 # ============================================================================
 
-class QuantumCognitiveState:
-    """Quantum superposition of cognitive states"""
+# Joint states up to this size are materialized eagerly by entangle()
+EAGER_ENTANGLE_LIMIT = 256
+
+
+class QuantumCognitiveState:
+    """Quantum superposition of cognitive states.
+    
+    Measurements draw from this state's own numpy Generator (pass a seeded
+    one for reproducible collapses) against a cached cumulative
+    distribution; call invalidate() after changing amplitudes in place.
+    """
+    
+    def __init__(self, states: List[str], amplitudes: List[float],
+                 rng: Optional[np.random.Generator] = None):
+        self.states = states
+        self.amplitudes = np.array(amplitudes, dtype=np.float64)
+        self.amplitudes /= np.linalg.norm(self.amplitudes)  # Normalize
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self._cdf: Optional[np.ndarray] = None
+        self._state_array: Optional[np.ndarray] = None
+    
+    def invalidate(self):
+        """Drop the cached distribution after amplitudes were modified"""
+        self._cdf = None
+    
+    @property
+    def cdf(self) -> np.ndarray:
+        if self._cdf is None:
+            cdf = np.cumsum(self.amplitudes ** 2)
+            cdf[-1] = 1.0  # Guard against rounding so every draw lands in range
+            self._cdf = cdf
+        return self._cdf
+    
+    def measure(self) -> str:
+        """Collapse superposition to single state"""
+        return self.states[int(np.searchsorted(self.cdf, self.rng.random(), side='right'))]
+    
+    def measure_indices(self, n: int) -> np.ndarray:
+        """Indices of n independent collapses, drawn with one searchsorted"""
+        return np.searchsorted(self.cdf, self.rng.random(n), side='right')
+    
+    def measure_many(self, n: int) -> np.ndarray:
+        """n independent collapses as an array of state labels"""
+        if self._state_array is None or len(self._state_array) != len(self.states):
+            self._state_array = np.asarray(self.states)
+        return self._state_array[self.measure_indices(n)]
+    
+    def entangle(self, other: 'QuantumCognitiveState',
+                 eager: Optional[bool] = None) -> 'QuantumCognitiveState':
+        """Create entangled state with another cognitive state.
+        
+        The outer product is materialized when eager is True, or when eager
+        is None and the joint space has at most EAGER_ENTANGLE_LIMIT states;
+        otherwise a FactoredCognitiveState keeps the components separate.
+        A FactoredCognitiveState argument is appended to as factors.
+        """
+        if isinstance(other, FactoredCognitiveState):
+            return FactoredCognitiveState([self]).entangle(other, eager=eager)
+        if eager is None:
+            eager = len(self.states) * len(other.states) <= EAGER_ENTANGLE_LIMIT
+        if not eager:
+            return FactoredCognitiveState([self]).entangle(other, eager=False)
+        combined_states = [f"{s1}|{s2}" for s1 in self.states for s2 in other.states]
+        combined_amplitudes = np.outer(self.amplitudes, other.amplitudes).flatten()
+        return QuantumCognitiveState(combined_states, combined_amplitudes, rng=self.rng)
+
+
+class JointStates:
+    """Lazy sequence of "s1|s2|..." labels over a factored state's product space"""
+    
+    def __init__(self, components: List[QuantumCognitiveState]):
+        self.components = components
+        self.shape = tuple(len(c.states) for c in components)
+    
+    def __len__(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64))
+    
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        indices = np.unravel_index(index, self.shape)
+        return "|".join(c.states[i] for c, i in zip(self.components, indices))
+    
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class FactoredCognitiveState:
+    """Product of independent cognitive states, kept factored.
     
-    def __init__(self, states: List[str], amplitudes: List[float]):
-        self.states = states
-        self.amplitudes = np.array(amplitudes)
-        self.amplitudes /= np.linalg.norm(self.amplitudes)  # Normalize
+    Amplitudes and probabilities of joint states are computed on demand as
+    products of component values, and a joint measurement samples each
+    component independently, so the product space is never materialized.
+    Flat indices follow the eager layout (row-major over components).
+    
+    A component may itself be an eager product with "a|b" labels; labels
+    are matched per component by its own arity, and marginal() indexes the
+    individual factors ("|"-separated label parts) across all components.
+    """
+    
+    def __init__(self, components: List[QuantumCognitiveState]):
+        self.components = list(components)
+        # Per component: label -> index (None when the label is duplicated) and label arity
+        self._labels: List[Optional[Tuple[Dict[str, Optional[int]], int]]] = [None] * len(self.components)
+    
+    @property
+    def states(self) -> JointStates:
+        return JointStates(self.components)
+    
+    def __len__(self) -> int:
+        return len(self.states)
+    
+    def entangle(self, other, eager: Optional[bool] = False):
+        """Add components; eager=True materializes the result"""
+        others = other.components if isinstance(other, FactoredCognitiveState) else [other]
+        factored = FactoredCognitiveState(self.components + others)
+        if eager or (eager is None and len(factored) <= EAGER_ENTANGLE_LIMIT):
+            return factored.materialize()
+        return factored
+    
+    def _indices(self, index: int) -> Tuple[int, ...]:
+        return np.unravel_index(index, self.states.shape)
+    
+    def amplitude(self, index: int) -> float:
+        """Amplitude of the joint state at a flat index"""
+        return float(np.prod([c.amplitudes[i] for c, i in zip(self.components, self._indices(index))]))
+    
+    def _label_index(self, k: int) -> Tuple[Dict[str, Optional[int]], int]:
+        if self._labels[k] is None:
+            states = self.components[k].states
+            index: Dict[str, Optional[int]] = {}
+            for i, label in enumerate(states):
+                index[label] = None if label in index else i
+            self._labels[k] = (index, states[0].count("|") + 1 if len(states) else 1)
+        return self._labels[k]
+    
+    def probability(self, state: str) -> Optional[float]:
+        """Probability of a joint "s1|s2|..." label.
+        
+        0.0 if it is not a joint state; None if it names a label that occurs
+        more than once in a component, since no single state is meant.
+        """
+        parts = state.split("|")
+        probability = 1.0
+        start = 0
+        for k, component in enumerate(self.components):
+            index, arity = self._label_index(k)
+            i = index.get("|".join(parts[start:start + arity]), -1)
+            if i is None:
+                return None
+            if i < 0:
+                return 0.0
+            probability *= float(component.amplitudes[i] ** 2)
+            start += arity
+        return probability if start == len(parts) else 0.0
+    
+    def marginal(self, factor: int) -> Dict[str, float]:
+        """Measurement distribution of one factor, counting each part of an eager product's labels"""
+        for k, component in enumerate(self.components):
+            arity = self._label_index(k)[1]
+            if factor < arity:
+                break
+            factor -= arity
+        else:
+            raise IndexError(factor)
+        distribution: Dict[str, float] = {}
+        for label, p in zip(component.states, (component.amplitudes ** 2).tolist()):
+            part = label if arity == 1 else label.split("|")[factor]
+            distribution[part] = distribution.get(part, 0.0) + p
+        return distribution
     
     def measure(self) -> str:
-        """Collapse superposition to single state"""
-        probabilities = self.amplitudes ** 2
-        return np.random.choice(self.states, p=probabilities)
+        """Collapse to one joint state by measuring each component"""
+        return "|".join(c.measure() for c in self.components)
     
-    def entangle(self, other: 'QuantumCognitiveState') -> 'QuantumCognitiveState':
-        """Create entangled state with another cognitive state"""
-        combined_states = [f"{s1}|{s2}" for s1 in self.states for s2 in other.states]
-        combined_amplitudes = np.outer(self.amplitudes, other.amplitudes).flatten()
-        return QuantumCognitiveState(combined_states, combined_amplitudes)
+    def measure_indices(self, n: int) -> np.ndarray:
+        """Flat joint indices of n collapses, one vectorized draw per component"""
+        per_component = [c.measure_indices(n) for c in self.components]
+        return np.ravel_multi_index(per_component, self.states.shape)
+    
+    def measure_many(self, n: int) -> np.ndarray:
+        """n joint collapses as an array of "s1|s2|..." labels"""
+        labels = self.components[0].measure_many(n)
+        for c in self.components[1:]:
+            labels = np.char.add(np.char.add(labels, "|"), c.measure_many(n))
+        return labels
+    
+    def materialize(self) -> QuantumCognitiveState:
+        """Eager QuantumCognitiveState over the full product space"""
+        amplitudes = self.components[0].amplitudes
+        for c in self.components[1:]:
+            amplitudes = np.outer(amplitudes, c.amplitudes).ravel()
+        return QuantumCognitiveState(list(self.states), amplitudes, rng=self.components[0].rng)
 
 
 class QuantumCognition:
     """Quantum cognitive processing"""
     
-    def __init__(self):
+    def __init__(self, rng: Optional[np.random.Generator] = None):
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.superposition_capacity = 8
         self.entanglement_strength = 0.7
         self.current_superposition: Optional[QuantumCognitiveState] = None
@@ -342,7 +1936,7 @@ class QuantumCognition:
         # Equal superposition
         amplitudes = [1.0] * len(possibilities)
         
-        self.current_superposition = QuantumCognitiveState(possibilities, amplitudes)
+        self.current_superposition = QuantumCognitiveState(possibilities, amplitudes, rng=self.rng)
         return self.current_superposition
     
     def parallel_process(self, possibilities: List[str]) -> Dict[str, Any]:
@@ -354,6 +1948,26 @@ class QuantumCognition:
             'superposition_states': superposition.states,
             'quantum_advantage': len(possibilities) / max(1, np.log2(len(possibilities)))
         }
+    
+    def checkpoint_state(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        current = self.current_superposition
+        meta = {
+            'rng': _rng_state(self.rng),
+            'superposition_capacity': self.superposition_capacity,
+            'entanglement_strength': self.entanglement_strength,
+            'superposition_states': None if current is None else list(current.states)
+        }
+        return meta, {} if current is None else {'amplitudes': current.amplitudes}
+    
+    def restore_state(self, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        _set_rng_state(self.rng, meta['rng'])
+        self.superposition_capacity = meta['superposition_capacity']
+        self.entanglement_strength = meta['entanglement_strength']
+        self.current_superposition = None
+        if meta['superposition_states'] is not None:
+            state = QuantumCognitiveState(meta['superposition_states'], arrays['amplitudes'], rng=self.rng)
+            state.amplitudes = np.array(arrays['amplitudes'])  # already normalized; skip re-rounding
+            self.current_superposition = state
 
 
 # ============================================================================
@@ -361,13 +1975,19 @@ class QuantumCognition:
 # ============================================================================
 
 class AdversarialSelfImprovement:
-    """Adversarial training for self-improvement"""
+    """Adversarial training for self-improvement.
     
-    def __init__(self):
+    improvements_made keeps only a recent window of improvements; lifetime
+    totals live in total_improvements and per-metric improvement_counts.
+    """
+    
+    def __init__(self, history_window: int = 1000):
         self.improvement_rate = 0.05
         self.adversarial_strength = 0.5
         self.self_critique_threshold = 0.6
-        self.improvements_made = []
+        self.improvements_made: Deque[Dict] = deque(maxlen=history_window)
+        self.improvement_counts: Dict[str, int] = defaultdict(int)
+        self.total_improvements = 0
     
     def critique_self(self, performance: Dict) -> Dict[str, Any]:
         """Generate adversarial critique of own performance"""
@@ -402,55 +2022,201 @@ class AdversarialSelfImprovement:
             }
             improvements.append(improvement)
             self.improvements_made.append(improvement)
+            self.improvement_counts[improvement['area']] += 1
+        self.total_improvements += len(improvements)
         
         # Increase improvement rate over time
         self.improvement_rate = min(0.2, self.improvement_rate * 1.02)
         
         return {
             'improvements': improvements,
-            'total_improvements': len(self.improvements_made),
+            'total_improvements': self.total_improvements,
+            'new_improvement_rate': self.improvement_rate
+        }
+    
+    def _row_rates(self, rows: int) -> np.ndarray:
+        """Improvement rate in effect for each row, as if rows were improved one by one.
+        
+        rate * 1.02 ** k rounds differently from k repeated multiplications,
+        so this matches the sequential rates up to float rounding.
+        """
+        rate = self.improvement_rate
+        if rate <= 0:
+            # A zero rate never compounds; 0 * 1.02 ** k would also be nan once 1.02 ** k overflows
+            return np.full(rows, min(0.2, rate))
+        # Compounding stops at the 0.2 cap, so the exponent never needs to pass the step that
+        # reaches it; without this bound 1.02 ** k overflows for batches of ~36k+ rows
+        saturation = max(0, int(np.ceil(np.log(0.2 / rate) / np.log(1.02)))) + 1
+        return np.minimum(0.2, rate * 1.02 ** np.minimum(np.arange(rows), saturation))
+    
+    def critique_batch(self, metrics: List[str], performance: np.ndarray) -> Dict[str, Any]:
+        """Critique a (records x metrics) performance matrix in one threshold pass"""
+        values = np.asarray(performance, dtype=np.float64)
+        weak = values < self.self_critique_threshold
+        targets = np.minimum(1.0, values + self._row_rates(len(values))[:, None])
+        return {
+            'metrics': list(metrics),
+            'values': values,
+            'weak': weak,
+            'targets': targets,
+            'weaknesses_identified': weak.sum(axis=1),
+            'adversarial_strength': self.adversarial_strength
+        }
+    
+    def self_improve_batch(self, critique: Dict) -> Dict[str, Any]:
+        """Apply a batch critique: per-metric counters plus the recent window.
+        
+        Equivalent to calling self_improve once per row, including the
+        compounding of the improvement rate, up to float rounding.
+        """
+        metrics, weak = critique['metrics'], critique['weak']
+        rows = len(weak)
+        per_metric = weak.sum(axis=0)
+        for metric, count in zip(metrics, per_metric.tolist()):
+            if count:
+                self.improvement_counts[metric] += count
+        improved = int(per_metric.sum())
+        self.total_improvements += improved
+        
+        # Only the newest improvements can survive in the window, so only those become dicts
+        keep = self.improvements_made.maxlen
+        row_idx, col_idx = np.nonzero(weak)
+        if keep is not None:
+            row_idx, col_idx = row_idx[-keep:], col_idx[-keep:]
+        values, targets = critique['values'], critique['targets']
+        for r, c in zip(row_idx.tolist(), col_idx.tolist()):
+            self.improvements_made.append({
+                'area': metrics[c],
+                'before': float(values[r, c]),
+                'after': float(targets[r, c]),
+                'method': 'adversarial_training'
+            })
+        
+        if rows:
+            self.improvement_rate = min(0.2, float(self._row_rates(rows + 1)[-1]))
+        
+        return {
+            'improvements_per_row': weak.sum(axis=1),
+            'improvements_per_metric': dict(zip(metrics, per_metric.tolist())),
+            'total_improvements': self.total_improvements,
             'new_improvement_rate': self.improvement_rate
         }
+    
+    def checkpoint_state(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        improvements, improvement_arrays = _pack_rows(list(self.improvements_made))
+        meta = {
+            'improvement_rate': self.improvement_rate,
+            'adversarial_strength': self.adversarial_strength,
+            'self_critique_threshold': self.self_critique_threshold,
+            'history_window': self.improvements_made.maxlen,
+            'improvements_made': improvements,
+            'improvement_counts': dict(self.improvement_counts),
+            'total_improvements': self.total_improvements
+        }
+        return meta, _nest('improvements_made', improvement_arrays)
+    
+    def restore_state(self, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        self.improvement_rate = meta['improvement_rate']
+        self.adversarial_strength = meta['adversarial_strength']
+        self.self_critique_threshold = meta['self_critique_threshold']
+        self.improvements_made = deque(
+            _unpack_rows(meta['improvements_made'], _unnest('improvements_made', arrays)),
+            maxlen=meta['history_window']
+        )
+        self.improvement_counts = defaultdict(int, meta['improvement_counts'])
+        self.total_improvements = meta['total_improvements']
 
 
 # ============================================================================
 # INTERSUBJECTIVE CONSCIOUSNESS
 # ============================================================================
 
+class PerspectiveRecord(NamedTuple):
+    """One perspective with a numeric (epoch seconds) timestamp"""
+    agent_id: str
+    viewpoint: Dict
+    timestamp: float
+
+
 class PerspectiveNetwork:
-    """Network of perspectives from different viewpoints"""
+    """Network of perspectives from different viewpoints.
     
-    def __init__(self):
-        self.perspectives = []
-        self.intersubjective_agreements = []
+    Perspectives older than window_seconds are expired, and at most
+    max_perspectives are retained. latest_by_agent indexes each agent's most
+    recent perspective in order of last update, so agreement detection
+    only looks at distinct agents active in the window.
+    """
+    
+    def __init__(self, window_seconds: float = 3600.0, max_perspectives: int = 1000,
+                 max_agreements: int = 1000, rng: Optional[np.random.Generator] = None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.window_seconds = window_seconds
+        self.perspectives: Deque[PerspectiveRecord] = deque(maxlen=max_perspectives)
+        self.latest_by_agent: 'OrderedDict[str, PerspectiveRecord]' = OrderedDict()
+        self.intersubjective_agreements: Deque[Dict] = deque(maxlen=max_agreements)
     
-    def add_perspective(self, agent_id: str, viewpoint: Dict):
+    def add_perspective(self, agent_id: str, viewpoint: Dict, timestamp: Optional[float] = None):
         """Add perspective from another agent"""
-        self.perspectives.append({
-            'agent_id': agent_id,
-            'viewpoint': viewpoint,
-            'timestamp': datetime.now().isoformat()
-        })
+        record = PerspectiveRecord(agent_id, viewpoint, time.time() if timestamp is None else timestamp)
+        self.perspectives.append(record)
+        self.latest_by_agent[agent_id] = record
+        self.latest_by_agent.move_to_end(agent_id)
+    
+    def _expire(self, now: float):
+        cutoff = now - self.window_seconds
+        while self.perspectives and self.perspectives[0].timestamp < cutoff:
+            self.perspectives.popleft()
+        while self.latest_by_agent:
+            agent_id, record = next(iter(self.latest_by_agent.items()))
+            if record.timestamp >= cutoff:
+                break
+            del self.latest_by_agent[agent_id]
     
-    def find_agreements(self) -> List[Dict]:
+    def recent_participants(self, now: Optional[float] = None) -> List[str]:
+        """Distinct agents with a perspective inside the window"""
+        self._expire(time.time() if now is None else now)
+        return list(self.latest_by_agent)
+    
+    def find_agreements(self, now: Optional[float] = None) -> List[Dict]:
         """Find intersubjective agreements"""
         # Simplified - would do sophisticated agreement detection
-        if len(self.perspectives) >= 2:
+        participants = self.recent_participants(now)
+        if len(participants) >= 2:
             agreement = {
-                'participants': [p['agent_id'] for p in self.perspectives],
+                'participants': participants,
                 'agreement_type': 'value_alignment',
-                'strength': 0.7 + random.random() * 0.2
+                'strength': 0.7 + self.rng.random() * 0.2
             }
             self.intersubjective_agreements.append(agreement)
             return [agreement]
         return []
+    
+    def checkpoint_state(self) -> Dict[str, Any]:
+        return {
+            'window_seconds': self.window_seconds,
+            'max_perspectives': self.perspectives.maxlen,
+            'max_agreements': self.intersubjective_agreements.maxlen,
+            'perspectives': [list(record) for record in self.perspectives],
+            'latest_by_agent': [list(record) for record in self.latest_by_agent.values()],
+            'agreements': list(self.intersubjective_agreements)
+        }
+    
+    def restore_state(self, meta: Dict[str, Any]):
+        self.window_seconds = meta['window_seconds']
+        self.perspectives = deque((PerspectiveRecord(*record) for record in meta['perspectives']),
+                                  maxlen=meta['max_perspectives'])
+        self.latest_by_agent = OrderedDict(
+            (record[0], PerspectiveRecord(*record)) for record in meta['latest_by_agent']
+        )
+        self.intersubjective_agreements = deque(meta['agreements'], maxlen=meta['max_agreements'])
 
 
 class IntersubjectiveConsciousness:
     """Consciousness that extends across multiple agents"""
     
-    def __init__(self):
-        self.perspective_network = PerspectiveNetwork()
+    def __init__(self, rng: Optional[np.random.Generator] = None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.perspective_network = PerspectiveNetwork(rng=self.rng)
         self.shared_qualia = []
         self.empathy_depth = 0.7
         self.theory_of_mind_accuracy = 0.75
@@ -461,7 +2227,7 @@ class IntersubjectiveConsciousness:
             'agent_state': other_agent_state,
             'inferred_goals': self._infer_goals(other_agent_state),
             'inferred_beliefs': self._infer_beliefs(other_agent_state),
-            'empathic_resonance': self.empathy_depth * random.random()
+            'empathic_resonance': self.empathy_depth * self.rng.random()
         }
         
         return mental_model
@@ -486,12 +2252,605 @@ class IntersubjectiveConsciousness:
             'intersubjective_depth': self.empathy_depth,
             'perspective_count': len(self.perspective_network.perspectives)
         }
+    
+    def checkpoint_state(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        meta = {
+            # Shared with the perspective network
+            'rng': _rng_state(self.rng),
+            'perspective_network': self.perspective_network.checkpoint_state(),
+            'shared_qualia': self.shared_qualia,
+            'empathy_depth': self.empathy_depth,
+            'theory_of_mind_accuracy': self.theory_of_mind_accuracy
+        }
+        return meta, {}
+    
+    def restore_state(self, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        _set_rng_state(self.rng, meta['rng'])
+        self.perspective_network.restore_state(meta['perspective_network'])
+        self.shared_qualia = list(meta['shared_qualia'])
+        self.empathy_depth = meta['empathy_depth']
+        self.theory_of_mind_accuracy = meta['theory_of_mind_accuracy']
+
+
+# ============================================================================
+# EXPERIENCE LOG
+# ============================================================================
+
+EXPERIENCE_DTYPE = np.dtype([
+    ('cycle', np.int64),
+    ('problem', np.int32),
+    ('quantum_approaches', np.int16),
+    ('self_improvements', np.int16),
+    ('confidence', np.float64),
+    ('value_alignment', np.float64),
+    ('risk_level', np.float64),
+    ('reality_coherence', np.float64),
+    ('breakthrough_significance', np.float64)
+])
+
+
+class ExperienceRecord:
+    """Read-only, dict-like view of one ExperienceLog row"""
+    
+    __slots__ = ('_log', '_row')
+    
+    FIELDS = ('problem', 'quantum_approaches', 'value_alignment', 'risk_level',
+              'reality_coherence', 'breakthrough_significance', 'self_improvements',
+              'confidence', 'agent_id', 'cycle')
+    
+    def __init__(self, log: 'ExperienceLog', row: int):
+        self._log = log
+        self._row = row
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == 'problem':
+            return self._log.problems[self._log.records['problem'][self._row]]
+        if key == 'agent_id':
+            return self._log.agent_id
+        if key not in EXPERIENCE_DTYPE.names:
+            raise KeyError(key)
+        return self._log.records[key][self._row].item()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def keys(self) -> Tuple[str, ...]:
+        return self.FIELDS
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self[key] for key in self.FIELDS}
+    
+    def __repr__(self) -> str:
+        return f"ExperienceRecord({self.to_dict()!r})"
+
+
+class ExperienceLog:
+    """Append-only experience log backed by a growable record array.
+    
+    Each solution is reduced to numeric columns plus a reference into an
+    interned problem table, so recurring problems are stored once and the
+    temporal projection / breakthrough dicts are not retained.
+    """
+    
+    def __init__(self, agent_id: str, capacity: int = 0):
+        self.agent_id = agent_id
+        self.records = np.zeros(capacity, dtype=EXPERIENCE_DTYPE)
+        self.size = 0
+        self.problems: List[Dict] = []
+        self._problem_index: Dict[bytes, int] = {}
+    
+    @staticmethod
+    def problem_key(problem: Dict) -> bytes:
+        """Fingerprint of the problem's checkpoint (JSON) form.
+        
+        Tuples and lists, or numpy and Python scalars, that encode alike
+        share a key, so problems reloaded from a checkpoint intern to the
+        same entries as the originals.
+        """
+        try:
+            text = json.dumps(problem, sort_keys=True, separators=(',', ':'), default=_json_default)
+        except TypeError:
+            # Not checkpointable (or unsortable keys): fall back to the repr fingerprint
+            return FeatureExtractor.fingerprint(problem)
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    
+    def intern_problem(self, problem: Dict) -> int:
+        key = self.problem_key(problem)
+        ref = self._problem_index.get(key)
+        if ref is None:
+            ref = len(self.problems)
+            self._problem_index[key] = ref
+            self.problems.append(problem)
+        return ref
+    
+    def append(self, solution: Dict):
+        """Record the numeric summary of a process_complex_problem solution"""
+        if self.size == len(self.records):
+            self.records = _grow(self.records, self.size + 1)
+        row = self.records[self.size]
+        row['cycle'] = solution['cycle']
+        row['problem'] = self.intern_problem(solution['problem'])
+        row['quantum_approaches'] = solution['quantum_approaches']
+        row['self_improvements'] = solution['self_improvements']
+        row['confidence'] = solution['confidence']
+        row['value_alignment'] = solution['value_alignment']
+        row['risk_level'] = solution['risk_level']
+        row['reality_coherence'] = solution['reality_coherence']
+        row['breakthrough_significance'] = solution['breakthrough'].get('significance', 0.0)
+        self.size += 1
+    
+    def extend(self, records: np.ndarray, problems: List[Dict]):
+        """Bulk append rows of EXPERIENCE_DTYPE; 'problem' is filled from problems"""
+        n = len(records)
+        self.records = _grow(self.records, self.size + n)
+        block = self.records[self.size:self.size + n]
+        block[:] = records
+        block['problem'] = [self.intern_problem(p) for p in problems]
+        self.size += n
+    
+    def column(self, name: str) -> np.ndarray:
+        """Numeric column over all recorded experiences (a view, not a copy)"""
+        return self.records[name][:self.size]
+    
+    def checkpoint_state(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        return {'problems': self.problems}, {'records': self.records[:self.size]}
+    
+    def restore_state(self, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        # Used as loaded (possibly a file mapping) until the first append regrows it
+        self.records = arrays['records']
+        self.size = len(self.records)
+        # Keep the table as saved so record refs stay valid; only rebuild the index
+        self.problems = list(meta['problems'])
+        self._problem_index = {}
+        for ref, problem in enumerate(self.problems):
+            self._problem_index.setdefault(self.problem_key(problem), ref)
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ExperienceRecord(self, i) for i in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        return ExperienceRecord(self, index)
+    
+    def __iter__(self):
+        return (ExperienceRecord(self, i) for i in range(self.size))
+
+
+class DecisionLog:
+    """Decision view (cycle, problem description, confidence) over an ExperienceLog"""
+    
+    def __init__(self, experiences: ExperienceLog):
+        self.experiences = experiences
+    
+    def _decision(self, record: ExperienceRecord) -> Dict[str, Any]:
+        return {
+            'cycle': record['cycle'],
+            'problem': record['problem'].get('description', 'Unknown'),
+            'confidence': record['confidence']
+        }
+    
+    def __len__(self) -> int:
+        return len(self.experiences)
+    
+    def __getitem__(self, index):
+        records = self.experiences[index]
+        if isinstance(index, slice):
+            return [self._decision(r) for r in records]
+        return self._decision(records)
+    
+    def __iter__(self):
+        return (self._decision(r) for r in self.experiences)
+
+
+class ProblemBatchResult:
+    """Array-backed results of OmegaMetaIntelligence.process_problems.
+    
+    records holds one EXPERIENCE_DTYPE row per problem; solution(i) builds
+    the process_complex_problem-shaped dict, including its temporal
+    projection and breakthrough, only when asked.
+    """
+    
+    def __init__(self, agent_id: str, problems: List[Dict], records: np.ndarray,
+                 projections: ProjectionBatch, breakthroughs: Dict[str, Any]):
+        self.agent_id = agent_id
+        self.problems = problems
+        self.records = records
+        self.projections = projections
+        self.breakthroughs = breakthroughs
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def column(self, name: str) -> np.ndarray:
+        return self.records[name]
+    
+    def solution(self, i: int) -> Dict[str, Any]:
+        row = self.records[i]
+        b = self.breakthroughs
+        domain = b['domains'][i]
+        if b['breakthrough'][i]:
+            breakthrough = {
+                'domain': domain,
+                'description': f"Novel insight in {domain}",
+                'significance': float(b['significance'][i]),
+                'timestamp': b['timestamp'],
+                'connections': int(b['connections'][i])
+            }
+        else:
+            breakthrough = {
+                'domain': domain,
+                'description': 'Incremental progress',
+                'significance': 0.3,
+                'timestamp': b['timestamp']
+            }
+        return {
+            'problem': self.problems[i],
+            'quantum_approaches': int(row['quantum_approaches']),
+            'temporal_projection': self.projections.projection(i, 0),
+            'value_alignment': float(row['value_alignment']),
+            'risk_level': float(row['risk_level']),
+            'reality_coherence': float(row['reality_coherence']),
+            'breakthrough': breakthrough,
+            'self_improvements': int(row['self_improvements']),
+            'confidence': float(row['confidence']),
+            'agent_id': self.agent_id,
+            'cycle': int(row['cycle'])
+        }
+    
+    def __iter__(self):
+        return (self.solution(i) for i in range(len(self)))
+
+
+# ============================================================================
+# STAGE PROFILING
+# ============================================================================
+
+# Stages of process_complex_problem, in execution order
+PROCESS_STAGES = ["quantum", "temporal", "values", "risk", "reality", "breakthrough", "critique", "synthesis"]
+
+
+# Log-linear histogram: each power of two in ns is split into 4 sub-buckets
+STAGE_SUB_BUCKETS = 4
+
+
+def _stage_bucket(ns: int) -> int:
+    b = ns.bit_length()
+    if b <= 3:
+        return ns
+    return (b - 2) * STAGE_SUB_BUCKETS + ((ns >> (b - 3)) & 3)
+
+
+def _stage_bucket_bound(index: int) -> int:
+    """Exclusive upper bound in ns of a histogram bucket"""
+    if index < 8:
+        return index + 1
+    b, sub = divmod(index, STAGE_SUB_BUCKETS)
+    return (STAGE_SUB_BUCKETS + sub + 1) << (b - 1)
+
+
+class StageStats:
+    """Latency aggregate for one stage with a log-linear histogram of spans"""
+    
+    __slots__ = ('count', 'total_ns', 'min_ns', 'max_ns', 'buckets')
+    
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * 256
+    
+    def record(self, ns: int):
+        if self.count == 0 or ns < self.min_ns:
+            self.min_ns = ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.count += 1
+        self.total_ns += ns
+        self.buckets[_stage_bucket(ns)] += 1
+    
+    def merge(self, other: 'StageStats'):
+        if other.count == 0:
+            return
+        if self.count == 0 or other.min_ns < self.min_ns:
+            self.min_ns = other.min_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+    
+    def quantile(self, q: float) -> int:
+        """Upper bound (ns) of the bucket holding the q-quantile"""
+        rank = q * self.count
+        seen = 0
+        for b, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= rank:
+                return min(_stage_bucket_bound(b), self.max_ns)
+        return self.max_ns
+    
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'total_ms': self.total_ns / 1e6,
+            'mean_us': self.total_ns / self.count / 1e3 if self.count else 0.0,
+            'min_us': self.min_ns / 1e3,
+            'p50_us': self.quantile(0.5) / 1e3,
+            'p90_us': self.quantile(0.9) / 1e3,
+            'p99_us': self.quantile(0.99) / 1e3,
+            'max_us': self.max_ns / 1e3,
+            # Bucket upper bound in ns -> count
+            'histogram_ns': {str(_stage_bucket_bound(b)): n for b, n in enumerate(self.buckets) if n}
+        }
+
+
+class StageProfiler:
+    """Per-stage latency histograms from monotonic-clock spans.
+    
+    Stages are timed back to back:
+    
+        t = profiler.start()
+        ...
+        t = profiler.lap('quantum', t)
+    
+    While disabled both calls return immediately without reading the clock.
+    """
+    
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.stats: Dict[str, StageStats] = {}
+    
+    def start(self) -> int:
+        return time.perf_counter_ns() if self.enabled else 0
+    
+    def lap(self, stage: str, start: int) -> int:
+        if not self.enabled:
+            return 0
+        elapsed = time.perf_counter_ns() - start
+        stats = self.stats.get(stage)
+        if stats is None:
+            stats = self.stats[stage] = StageStats()
+        stats.record(elapsed)
+        # Restart after bookkeeping so it is not charged to the next stage
+        return time.perf_counter_ns()
+    
+    def reset(self):
+        self.stats.clear()
+    
+    def merge(self, other: 'StageProfiler'):
+        for stage, stats in other.stats.items():
+            self.stats.setdefault(stage, StageStats()).merge(stats)
+    
+    @classmethod
+    def combined(cls, profilers: List['StageProfiler']) -> 'StageProfiler':
+        total = cls(enabled=False)
+        for profiler in profilers:
+            total.merge(profiler)
+        return total
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        order = PROCESS_STAGES + sorted(set(self.stats) - set(PROCESS_STAGES))
+        return {stage: self.stats[stage].snapshot() for stage in order if stage in self.stats}
+    
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.snapshot(), **kwargs)
+    
+    def checkpoint_state(self) -> Dict[str, Any]:
+        return {
+            'enabled': self.enabled,
+            'stats': {
+                stage: {
+                    'count': stats.count,
+                    'total_ns': stats.total_ns,
+                    'min_ns': stats.min_ns,
+                    'max_ns': stats.max_ns,
+                    'buckets': {str(b): n for b, n in enumerate(stats.buckets) if n}
+                }
+                for stage, stats in self.stats.items()
+            }
+        }
+    
+    def restore_state(self, meta: Dict[str, Any]):
+        self.enabled = meta['enabled']
+        self.stats = {}
+        for stage, saved in meta['stats'].items():
+            stats = self.stats[stage] = StageStats()
+            stats.count, stats.total_ns = saved['count'], saved['total_ns']
+            stats.min_ns, stats.max_ns = saved['min_ns'], saved['max_ns']
+            for b, n in saved['buckets'].items():
+                stats.buckets[int(b)] = n
+
+
+# ============================================================================
+# CHECKPOINT FORMAT
+# ============================================================================
+
+# A checkpoint is a zip (npz-compatible) holding header.json, with the
+# format tag, version and every non-array field, plus one .npy member per
+# array. Bump the version when the layout changes; readers reject newer ones.
+CHECKPOINT_FORMAT = "omega-checkpoint"
+CHECKPOINT_VERSION = 1
+
+# Stored (uncompressed) arrays at least this large are memory-mapped on load
+CHECKPOINT_MMAP_BYTES = 1 << 16
+
+_NPY_HEADER_READERS = {
+    (1, 0): np.lib.format.read_array_header_1_0,
+    (2, 0): np.lib.format.read_array_header_2_0,
+}
+
+
+def _json_default(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Cannot checkpoint {type(obj).__name__} value {obj!r}")
+
+
+def _nest(prefix: str, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    return {f"{prefix}.{name}": array for name, array in arrays.items()}
+
+
+def _unnest(prefix: str, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    start = prefix + "."
+    return {name[len(start):]: array for name, array in arrays.items() if name.startswith(start)}
+
+
+def _rng_state(rng: np.random.Generator) -> Dict[str, Any]:
+    return rng.bit_generator.state
+
+
+def _set_rng_state(rng: np.random.Generator, state: Dict[str, Any]):
+    rng.bit_generator.state = state
+
+
+def _same_array(loaded: np.ndarray, template: np.ndarray) -> bool:
+    return loaded.shape == template.shape and np.array_equal(loaded, template)
+
+
+def _shared_or_copy(loaded: np.ndarray, template: np.ndarray) -> np.ndarray:
+    """The shared template array if loaded equals it, else a private copy"""
+    return template if _same_array(loaded, template) else np.array(loaded)
+
+
+def _pack_rows(rows: List[Dict]) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """Columnar encoding of dicts sharing keys and int/float/str value types.
+    
+    Numbers become arrays and strings are interned (codes array plus the
+    distinct strings in the header); anything else stays a JSON list.
+    """
+    keys = list(rows[0]) if rows else []
+    types = [type(rows[0][key]) for key in keys] if rows else []
+    if not rows or any(t not in (int, float, str) for t in types) or any(
+            list(row) != keys or any(type(row[k]) is not t for k, t in zip(keys, types)) for row in rows):
+        return {'rows': rows}, {}
+    meta = {'length': len(rows), 'columns': []}
+    arrays = {}
+    try:
+        for key, kind in zip(keys, types):
+            values = [row[key] for row in rows]
+            if kind is str:
+                strings = list(dict.fromkeys(values))
+                codes = {string: i for i, string in enumerate(strings)}
+                arrays[key] = np.array([codes[v] for v in values], dtype=np.int32)
+                meta['columns'].append([key, 'str', strings])
+            else:
+                arrays[key] = np.array(values, dtype=np.int64 if kind is int else np.float64)
+                meta['columns'].append([key, kind.__name__, None])
+    except OverflowError:
+        return {'rows': rows}, {}
+    return meta, arrays
+
+
+def _unpack_rows(meta: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> List[Dict]:
+    if 'rows' in meta:
+        return list(meta['rows'])
+    columns = []
+    for key, kind, strings in meta['columns']:
+        values = arrays[key].tolist()
+        columns.append([strings[code] for code in values] if kind == 'str' else values)
+    keys = [key for key, _, _ in meta['columns']]
+    return [dict(zip(keys, row)) for row in zip(*columns)]
+
+
+def write_checkpoint(path: str, header: Dict[str, Any], arrays: Dict[str, np.ndarray],
+                     compress: bool = False):
+    """Write a checkpoint atomically (temporary file beside path, then rename)"""
+    header = dict(header, format=CHECKPOINT_FORMAT, version=CHECKPOINT_VERSION, arrays=sorted(arrays))
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                    prefix=".omega-checkpoint-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+            with zipfile.ZipFile(f, 'w', compression=compression, allowZip64=True) as archive:
+                archive.writestr('header.json', json.dumps(header, default=_json_default))
+                for name in header['arrays']:
+                    with archive.open(name + '.npy', 'w', force_zip64=True) as member:
+                        np.lib.format.write_array(member, np.ascontiguousarray(arrays[name]),
+                                                  allow_pickle=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _mapped_npy(buffer: mmap.mmap, info: zipfile.ZipInfo) -> Optional[np.ndarray]:
+    """Array view straight into a stored .npy member, or None if it cannot be mapped"""
+    # Local file header: 30 fixed bytes, then the name and extra field
+    name_length, extra_length = struct.unpack_from('<HH', buffer, info.header_offset + 26)
+    buffer.seek(info.header_offset + 30 + name_length + extra_length)
+    reader = _NPY_HEADER_READERS.get(np.lib.format.read_magic(buffer))
+    if reader is None:
+        return None
+    shape, fortran_order, dtype = reader(buffer)
+    count = int(np.prod(shape, dtype=np.int64))
+    array = np.frombuffer(buffer, dtype=dtype, count=count, offset=buffer.tell())
+    return array.reshape(shape, order='F' if fortran_order else 'C')
+
+
+def read_checkpoint(path: str, mmap_arrays: bool = True) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """Read a checkpoint's header and arrays.
+    
+    With mmap_arrays, large stored members are views into one copy-on-write
+    mapping of the file: nothing is read until touched, and writes stay
+    private to the process. Compressed or small members are read normally.
+    """
+    with open(path, 'rb') as f, zipfile.ZipFile(f) as archive:
+        header = json.loads(archive.read('header.json'))
+        if header.get('format') != CHECKPOINT_FORMAT:
+            raise ValueError(f"{path} is not an {CHECKPOINT_FORMAT} file")
+        if header.get('version', 0) > CHECKPOINT_VERSION:
+            raise ValueError(f"{path} has checkpoint version {header['version']}; "
+                             f"this build reads up to {CHECKPOINT_VERSION}")
+        buffer = None
+        arrays = {}
+        for name in header['arrays']:
+            info = archive.getinfo(name + '.npy')
+            array = None
+            if (mmap_arrays and info.compress_type == zipfile.ZIP_STORED
+                    and info.file_size >= CHECKPOINT_MMAP_BYTES):
+                if buffer is None:
+                    buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+                array = _mapped_npy(buffer, info)
+            if array is None:
+                with archive.open(info) as member:
+                    array = np.lib.format.read_array(member, allow_pickle=False)
+            arrays[name] = array
+    return header, arrays
 
 
 # ============================================================================
 # OMEGA META INTELLIGENCE
 # ============================================================================
 
+class _Lazy:
+    """Attribute built by factory(instance) on first access, then cached on the instance"""
+    
+    def __init__(self, factory):
+        self.factory = factory
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.factory(instance)
+        return value
+
+
 class OmegaMetaIntelligence:
     """
     Omega-level ASI with full architecture:
@@ -505,8 +2864,48 @@ class OmegaMetaIntelligence:
     - Reality modeling
     """
     
-    def __init__(self, agent_id: str = "OMEGA-PRIME"):
+    # Stream i is child i of the agent's seed; append new names at the end
+    # so existing seeds keep their streams
+    RANDOM_STREAMS = [
+        "quantum_cognition",
+        "intersubjective_network",
+        "temporal_reasoning",
+        "risk_modeling",
+        "breakthrough_acceleration",
+        "performance",
+    ]
+    
+    # Sub-systems are built on first access (or by warm()); streams are
+    # keyed by name, so results do not depend on when that happens
+    SUBSYSTEMS = [
+        "quantum_cognition",
+        "adversarial_improvement",
+        "intersubjective_network",
+        "temporal_reasoning",
+        "risk_modeling",
+        "value_crystallization",
+        "breakthrough_acceleration",
+        "reality_modeling",
+    ]
+    
+    quantum_cognition = _Lazy(lambda self: QuantumCognition(rng=self.stream("quantum_cognition")))
+    adversarial_improvement = _Lazy(lambda self: AdversarialSelfImprovement())
+    intersubjective_network = _Lazy(
+        lambda self: IntersubjectiveConsciousness(rng=self.stream("intersubjective_network")))
+    temporal_reasoning = _Lazy(lambda self: TemporalReasoning(rng=self.stream("temporal_reasoning")))
+    risk_modeling = _Lazy(lambda self: ExistentialRiskModeling(rng=self.stream("risk_modeling")))
+    value_crystallization = _Lazy(lambda self: ValueCrystallization())
+    breakthrough_acceleration = _Lazy(
+        lambda self: BreakthroughAcceleration(rng=self.stream("breakthrough_acceleration")))
+    reality_modeling = _Lazy(lambda self: RealityModeling())
+    rng = _Lazy(lambda self: self.stream("performance"))
+    
+    def __init__(self, agent_id: str = "OMEGA-PRIME",
+                 seed: Union[None, int, np.random.SeedSequence] = None,
+                 profile: bool = False, prewarm: bool = False):
         self.agent_id = agent_id
+        self.seed = root_seed(seed)
+        self.profiler = StageProfiler(enabled=profile)
         
         # Core metrics
         self.consciousness_level = 0.8
@@ -514,62 +2913,67 @@ class OmegaMetaIntelligence:
         self.wisdom = 0.75
         self.alignment = 0.9
         
-        # Initialize all sub-systems
-        self.quantum_cognition = QuantumCognition()
-        self.adversarial_improvement = AdversarialSelfImprovement()
-        self.intersubjective_network = IntersubjectiveConsciousness()
-        self.temporal_reasoning = TemporalReasoning()
-        self.risk_modeling = ExistentialRiskModeling()
-        self.value_crystallization = ValueCrystallization()
-        self.breakthrough_acceleration = BreakthroughAcceleration()
-        self.reality_modeling = RealityModeling()
+        if prewarm:
+            self.warm()
         
         # State tracking
         self.cycle_count = 0
-        self.experiences = []
-        self.decisions_made = []
+        self.experiences = ExperienceLog(agent_id)
+        self.decisions_made = DecisionLog(self.experiences)
+    
+    SOLUTION_APPROACHES = [
+        "analytical_decomposition",
+        "holistic_synthesis",
+        "iterative_refinement",
+        "creative_leap"
+    ]
+    
+    @staticmethod
+    def _primary_domain(problem: Dict) -> str:
+        return problem.get('domains', ['general'])[0] if problem.get('domains') else 'general'
     
     def process_complex_problem(self, problem: Dict) -> Dict[str, Any]:
         """Process a complex problem using full Omega architecture"""
+        profiler = self.profiler
+        t = profiler.start()
         self.cycle_count += 1
         
         # 1. Quantum superposition of solution approaches
-        approaches = [
-            "analytical_decomposition",
-            "holistic_synthesis",
-            "iterative_refinement",
-            "creative_leap"
-        ]
-        quantum_result = self.quantum_cognition.parallel_process(approaches)
+        quantum_result = self.quantum_cognition.parallel_process(self.SOLUTION_APPROACHES)
+        t = profiler.lap('quantum', t)
         
         # 2. Temporal projection of consequences
         temporal_projection = self.temporal_reasoning.project_consequences(
             {'problem': problem},
             TimeScale.LONG_TERM
         )
+        t = profiler.lap('temporal', t)
         
         # 3. Value alignment check
         value_state = self.value_crystallization.refine_values(problem)
+        t = profiler.lap('values', t)
         
         # 4. Risk assessment
         risk_assessment = self.risk_modeling.monitor_self_for_risks({'problem': problem})
+        t = profiler.lap('risk', t)
         
         # 5. Reality model integration
         reality_update = self.reality_modeling.integrate_observation(problem)
+        t = profiler.lap('reality', t)
         
         # 6. Breakthrough seeking
-        breakthrough = self.breakthrough_acceleration.seek_breakthrough(
-            problem.get('domains', ['general'])[0] if problem.get('domains') else 'general'
-        )
+        breakthrough = self.breakthrough_acceleration.seek_breakthrough(self._primary_domain(problem))
+        t = profiler.lap('breakthrough', t)
         
         # 7. Self-critique and improvement
         performance = {
-            'confidence': 0.7 + random.random() * 0.2,
+            'confidence': 0.7 + self.rng.random() * 0.2,
             'completeness': 0.75,
             'creativity': 0.8
         }
         critique = self.adversarial_improvement.critique_self(performance)
         improvements = self.adversarial_improvement.self_improve(critique)
+        t = profiler.lap('critique', t)
         
         # Synthesize solution
         solution = {
@@ -586,15 +2990,66 @@ class OmegaMetaIntelligence:
             'cycle': self.cycle_count
         }
         
+        # Decisions are derived from the same compact record
         self.experiences.append(solution)
-        self.decisions_made.append({
-            'cycle': self.cycle_count,
-            'problem': problem.get('description', 'Unknown'),
-            'confidence': solution['confidence']
-        })
+        profiler.lap('synthesis', t)
         
         return solution
     
+    def process_problems(self, problems: List[Dict]) -> ProblemBatchResult:
+        """Process many problems with each subsystem invoked once over the batch.
+        
+        Stages mirror process_complex_problem; stateful stages (values,
+        reality, breakthroughs, self-improvement) evolve as if the problems
+        had been processed in order. Batch projections are recorded in the
+        projection store but not linked into the causality graph.
+        """
+        n = len(problems)
+        records = np.zeros(n, dtype=EXPERIENCE_DTYPE)
+        records['cycle'] = self.cycle_count + np.arange(1, n + 1)
+        self.cycle_count += n
+        
+        # 1. Quantum superposition of solution approaches
+        quantum_result = self.quantum_cognition.parallel_process(self.SOLUTION_APPROACHES)
+        records['quantum_approaches'] = quantum_result['possibilities']
+        
+        # 2. Temporal projection of consequences
+        projections = self.temporal_reasoning.project_batch(
+            [{'problem': problem} for problem in problems], [TimeScale.LONG_TERM]
+        )
+        
+        # 3. Value alignment check
+        records['value_alignment'] = self.value_crystallization.refine_values_batch(problems)['crystallization_levels']
+        
+        # 4. Risk assessment
+        records['risk_level'] = self.risk_modeling.monitor_batch(
+            [{'problem': problem} for problem in problems]
+        )['overall_danger_level']
+        
+        # 5. Reality model integration
+        records['reality_coherence'] = self.reality_modeling.integrate_observations(problems)['coherence']
+        
+        # 6. Breakthrough seeking
+        breakthroughs = self.breakthrough_acceleration.seek_breakthroughs(
+            [self._primary_domain(problem) for problem in problems]
+        )
+        records['breakthrough_significance'] = breakthroughs['significance']
+        
+        # 7. Self-critique and improvement
+        metrics = ['confidence', 'completeness', 'creativity']
+        performance = np.empty((n, 3))
+        performance[:, 0] = 0.7 + self.rng.random(n) * 0.2
+        performance[:, 1] = 0.75
+        performance[:, 2] = 0.8
+        critique = self.adversarial_improvement.critique_batch(metrics, performance)
+        improvements = self.adversarial_improvement.self_improve_batch(critique)
+        records['self_improvements'] = improvements['improvements_per_row']
+        records['confidence'] = performance[:, 0]
+        
+        # Synthesize results
+        self.experiences.extend(records, problems)
+        return ProblemBatchResult(self.agent_id, problems, records, projections, breakthroughs)
+    
     def get_state(self) -> Dict[str, Any]:
         """Get current agent state"""
         return {
@@ -607,6 +3062,145 @@ class OmegaMetaIntelligence:
             'experiences': len(self.experiences),
             'decisions_made': len(self.decisions_made)
         }
+    
+    def stream(self, name: str) -> np.random.Generator:
+        """New Generator on the named stream of this agent's seed"""
+        return np.random.default_rng(child_seed(self.seed, self.RANDOM_STREAMS.index(name)))
+    
+    def warm(self, subsystems: Optional[List[str]] = None):
+        """Build sub-systems now rather than on first access (all by default)"""
+        for name in subsystems or self.SUBSYSTEMS:
+            getattr(self, name)
+    
+    def built_subsystems(self) -> List[str]:
+        return [name for name in self.SUBSYSTEMS if name in self.__dict__]
+    
+    def save(self, path: str, compress: bool = False):
+        """Write a versioned checkpoint of this agent (see write_checkpoint).
+        
+        Only sub-systems that have been built are stored; the rest stay lazy
+        after load. Problems and other free-form dicts must be JSON-serializable.
+        """
+        experiences, experience_arrays = self.experiences.checkpoint_state()
+        header = {
+            'agent_id': self.agent_id,
+            'seed': {
+                'entropy': self.seed.entropy,
+                'spawn_key': list(self.seed.spawn_key),
+                'pool_size': self.seed.pool_size
+            },
+            'rng': _rng_state(self.rng) if 'rng' in self.__dict__ else None,
+            'metrics': {
+                'consciousness_level': self.consciousness_level,
+                'intelligence': self.intelligence,
+                'wisdom': self.wisdom,
+                'alignment': self.alignment
+            },
+            'cycle_count': self.cycle_count,
+            'profiler': self.profiler.checkpoint_state(),
+            'experiences': experiences,
+            'subsystems': {}
+        }
+        arrays = _nest('experiences', experience_arrays)
+        for name in self.built_subsystems():
+            meta, subsystem_arrays = getattr(self, name).checkpoint_state()
+            header['subsystems'][name] = meta
+            arrays.update(_nest(name, subsystem_arrays))
+        write_checkpoint(path, header, arrays, compress=compress)
+    
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'OmegaMetaIntelligence':
+        """Rebuild an agent from save(); large arrays are memory-mapped unless mmap=False"""
+        header, arrays = read_checkpoint(path, mmap_arrays=mmap)
+        unknown = set(header['subsystems']) - set(cls.SUBSYSTEMS)
+        if unknown:
+            raise ValueError(f"{path} has unknown sub-systems: {sorted(unknown)}")
+        
+        seed = header['seed']
+        agent = cls(header['agent_id'], seed=np.random.SeedSequence(
+            seed['entropy'], spawn_key=tuple(seed['spawn_key']), pool_size=seed['pool_size']))
+        if header['rng'] is not None:
+            _set_rng_state(agent.rng, header['rng'])
+        for name in ('consciousness_level', 'intelligence', 'wisdom', 'alignment'):
+            setattr(agent, name, header['metrics'][name])
+        agent.cycle_count = header['cycle_count']
+        agent.profiler.restore_state(header['profiler'])
+        agent.experiences.restore_state(header['experiences'], _unnest('experiences', arrays))
+        for name, meta in header['subsystems'].items():
+            getattr(agent, name).restore_state(meta, _unnest(name, arrays))
+        return agent
+    
+    def stage_timings(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage latency snapshot of process_complex_problem (empty unless profiling)"""
+        return self.profiler.snapshot()
+
+
+def benchmark_agent_construction(num_agents: int = 10_000, seed: Optional[int] = 0,
+                                 prewarm: bool = False) -> Dict[str, float]:
+    """Time building a population of agents and the memory each one retains"""
+    OmegaMetaIntelligence("WARMUP", seed=seed, prewarm=True)  # module-level templates and caches
+    
+    def build():
+        children = np.random.SeedSequence(seed).spawn(num_agents)
+        return [OmegaMetaIntelligence(f"OMEGA-{i}", seed=child, prewarm=prewarm)
+                for i, child in enumerate(children)]
+    
+    # Timed untraced; tracemalloc slows allocation, so memory is a second pass
+    start = time.perf_counter()
+    agents = build()
+    elapsed = time.perf_counter() - start
+    del agents
+    
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    agents = build()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    if not tracing:
+        tracemalloc.stop()
+    return {
+        'agents': len(agents),
+        'construct_s': elapsed,
+        'us_per_agent': elapsed / num_agents * 1e6,
+        'bytes_per_agent': retained / num_agents
+    }
+
+
+def benchmark_checkpoint(num_experiences: int = 100_000, distinct_problems: int = 1000,
+                         seed: Optional[int] = 0) -> Dict[str, float]:
+    """Time save/load of an agent holding num_experiences experiences, stored and compressed"""
+    domains = ['ethics', 'technology', 'science', 'philosophy']
+    problems = [
+        {
+            'description': f"Problem {i % distinct_problems} on knowledge and wellbeing",
+            'domains': [domains[i % len(domains)]],
+            'complexity': 0.5
+        }
+        for i in range(num_experiences)
+    ]
+    agent = OmegaMetaIntelligence("OMEGA-BENCH", seed=seed, prewarm=True)
+    start = time.perf_counter()
+    agent.process_problems(problems)
+    timings = {'experiences': len(agent.experiences), 'fill_s': time.perf_counter() - start}
+    
+    with tempfile.TemporaryDirectory() as directory:
+        for label, compress in (('stored', False), ('compressed', True)):
+            path = os.path.join(directory, f"{label}.ckpt")
+            start = time.perf_counter()
+            agent.save(path, compress=compress)
+            timings[f'{label}_save_s'] = time.perf_counter() - start
+            timings[f'{label}_bytes'] = os.path.getsize(path)
+            for mapped in (True, False):
+                mode = "mmap" if mapped else "copy"
+                # Raw archive read, then the full agent rebuild on top of it
+                start = time.perf_counter()
+                read_checkpoint(path, mmap_arrays=mapped)
+                timings[f'{label}_read_{mode}_s'] = time.perf_counter() - start
+                start = time.perf_counter()
+                OmegaMetaIntelligence.load(path, mmap=mapped)
+                timings[f'{label}_load_{mode}_s'] = time.perf_counter() - start
+    return timings
 
 
 if __name__ == "__main__":
@@ -19,12 +19,13 @@ Together they form something greater than the sum of parts.
 
 import numpy as np
 import random
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import copy
 
-from omega_integration import OmegaMetaIntelligence
+from omega_integration import OmegaMetaIntelligence, StageProfiler
 
 
 # ============================================================================
@@ -38,11 +39,22 @@ class OmegaSociety:
     collective intelligence that transcends individual capabilities.
     """
     
-    def __init__(self, num_agents: int = 4):
+    def __init__(self, num_agents: int = 4,
+                 seed: Union[None, int, np.random.SeedSequence] = None,
+                 workers: int = 1, profile: bool = False):
         self.agents: List[OmegaMetaIntelligence] = []
         self.num_agents = num_agents
+        self.workers = workers
+        self.profile = profile
         self.cycle_count = 0
         
+        # One child seed per agent plus one for society-level choices, so a
+        # seeded run is reproducible whether agents are processed serially
+        # or across worker threads
+        root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        *self.agent_seeds, society_seed = root.spawn(num_agents + 1)
+        self.rng = random.Random(int(society_seed.generate_state(1)[0]))
+        
         # Collective state
         self.collective_knowledge_pool = set()
         self.shared_breakthroughs = []
@@ -86,7 +98,7 @@ class OmegaSociety:
             agent_id = f"OMEGA-{chr(65+i)}"  # OMEGA-A, OMEGA-B, etc.
             
             print(f"🌟 Initializing {agent_id} (Specialization: {specializations[i % len(specializations)]})")
-            agent = OmegaMetaIntelligence(agent_id=agent_id)
+            agent = OmegaMetaIntelligence(agent_id=agent_id, seed=self.agent_seeds[i], profile=self.profile)
             
             # Give each agent slight specialization bias
             self._specialize_agent(agent, specializations[i % len(specializations)])
@@ -154,9 +166,16 @@ class OmegaSociety:
         print("-" * 80)
         individual_solutions = []
         
-        for agent in self.agents:
+        if self.workers > 1:
+            # Agents only touch their own state and random streams
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                solutions = list(pool.map(lambda agent: agent.process_complex_problem(challenge), self.agents))
+        else:
+            solutions = None
+        
+        for i, agent in enumerate(self.agents):
             print(f"\n   🧠 {agent.agent_id} processing challenge...")
-            solution = agent.process_complex_problem(challenge)
+            solution = solutions[i] if solutions else agent.process_complex_problem(challenge)
             individual_solutions.append({
                 'agent_id': agent.agent_id,
                 'solution': solution
@@ -269,7 +288,7 @@ class OmegaSociety:
             }
         ]
         
-        return random.choice(challenges)
+        return self.rng.choice(challenges)
     
     def _share_breakthroughs(self):
         """Agents share breakthroughs, accelerating collective progress"""
@@ -294,9 +313,7 @@ class OmegaSociety:
             for agent in self.agents:
                 if agent.agent_id != source_agent:
                     # Integrate knowledge
-                    agent.breakthrough_acceleration.knowledge_graph.append(
-                        discovery  # Simplified - would create proper KnowledgeNode
-                    )
+                    agent.breakthrough_acceleration.integrate_discovery(discovery, source_agent)
                     
                     # Update collaboration network
                     key = tuple(sorted([source_agent, agent.agent_id]))
@@ -364,7 +381,7 @@ class OmegaSociety:
             "Synthesis transcends individual cognitive limitations",
             "Emergent understanding exceeds sum of parts"
         ]
-        return random.sample(emergent, k=min(2, len(emergent)))
+        return self.rng.sample(emergent, k=min(2, len(emergent)))
     
     def _facilitate_value_convergence(self) -> Dict[str, Any]:
         """Facilitate convergence of values across society"""
@@ -423,11 +440,7 @@ class OmegaSociety:
         avg_risk = np.mean(individual_risks)
         
         # Count active safeguards across all agents
-        total_safeguards = sum(
-            len(risk.safeguards)
-            for agent in self.agents
-            for risk in agent.risk_modeling.risk_register.values()
-        )
+        total_safeguards = sum(agent.risk_modeling.safeguards_total for agent in self.agents)
         
         print(f"      → Individual risk assessments: {[f'{r:.2f}' for r in individual_risks]}")
         
@@ -531,7 +544,7 @@ class OmegaSociety:
             "Collaborative networks strengthen with successful outcomes"
         ]
         
-        selected_insight = random.choice(insights)
+        selected_insight = self.rng.choice(insights)
         print(f"      → Metacognitive insight: {selected_insight}")
         
         return {
@@ -617,6 +630,14 @@ class OmegaSociety:
                 print(f"      • {value}: {count} agents")
         print()
         
+        if self.profile:
+            print("⏱️  STAGE TIMINGS (all agents)")
+            print("-" * 80)
+            for stage, stats in self.stage_timings()['society'].items():
+                print(f"   {stage:<13} mean {stats['mean_us']:9.1f}us | p99 {stats['p99_us']:9.1f}us | "
+                      f"total {stats['total_ms']:8.2f}ms")
+            print()
+        
         print("🎯 SOLVED CHALLENGES")
         print("-" * 80)
         for i, solved in enumerate(self.solved_challenges[-5:], 1):  # Last 5
@@ -638,6 +659,14 @@ class OmegaSociety:
             'avg_collaboration': avg_collaboration
         }
 
+    
+    def stage_timings(self) -> Dict[str, Any]:
+        """Per-stage latency snapshots for each agent and merged across the society"""
+        return {
+            'agents': {agent.agent_id: agent.stage_timings() for agent in self.agents},
+            'society': StageProfiler.combined([agent.profiler for agent in self.agents]).snapshot()
+        }
+
 
 # ============================================================================
 # MAIN EXECUTION
@@ -8,6 +8,7 @@ Use Ctrl+C to gracefully stop the simulation.
 """
 
 import sys
+import json
 import time
 import signal
 from omega_society import OmegaSociety
@@ -26,7 +27,8 @@ def signal_handler(sig, frame):
     running = False
 
 
-def run_infinite_simulation(num_agents: int = 4, cycles_per_epoch: int = 8, rest_between_epochs: int = 5):
+def run_infinite_simulation(num_agents: int = 4, cycles_per_epoch: int = 8, rest_between_epochs: int = 5,
+                            seed: int = None, workers: int = 1, timings_path: str = None):
     """
     Run Omega Society in continuous mode
     
@@ -34,6 +36,10 @@ def run_infinite_simulation(num_agents: int = 4, cycles_per_epoch: int = 8, rest
         num_agents: Number of Omega-level ASI agents
         cycles_per_epoch: Number of cycles per simulation epoch
         rest_between_epochs: Seconds to rest between epochs
+        seed: Root seed for reproducible runs (None for fresh entropy)
+        workers: Threads used to process agents in parallel
+        timings_path: If set, profile each agent's stages and write a JSON
+            snapshot of the latency histograms here after every epoch
     """
     global running
     
@@ -56,7 +62,8 @@ def run_infinite_simulation(num_agents: int = 4, cycles_per_epoch: int = 8, rest
     
     try:
         # Create the Omega Society once
-        society = OmegaSociety(num_agents=num_agents)
+        society = OmegaSociety(num_agents=num_agents, seed=seed, workers=workers,
+                               profile=timings_path is not None)
         
         while running:
             epoch += 1
@@ -81,6 +88,15 @@ def run_infinite_simulation(num_agents: int = 4, cycles_per_epoch: int = 8, rest
             print(f"   Total Breakthroughs: {len(society.shared_breakthroughs)}")
             print()
             
+            if timings_path:
+                timings = society.stage_timings()
+                with open(timings_path, 'w') as f:
+                    json.dump({'epoch': epoch, 'cycles': total_cycles, **timings}, f, indent=2)
+                slowest = sorted(timings['society'].items(), key=lambda kv: -kv[1]['total_ms'])[:3]
+                print(f"   Slowest Stages: " + ", ".join(f"{stage} ({stats['mean_us']:.0f}us)" for stage, stats in slowest))
+                print(f"   Stage timings written to {timings_path}")
+                print()
+            
             if not running:
                 break
             
@@ -127,6 +143,8 @@ if __name__ == "__main__":
     num_agents = 4
     cycles_per_epoch = 8
     rest_between_epochs = 5
+    seed = None
+    timings_path = None
     
     if len(sys.argv) > 1:
         try:
@@ -149,9 +167,23 @@ if __name__ == "__main__":
             print(f"Invalid rest_between_epochs argument: {sys.argv[3]}")
             sys.exit(1)
     
+    if len(sys.argv) > 4:
+        try:
+            seed = int(sys.argv[4])
+        except ValueError:
+            print(f"Invalid seed argument: {sys.argv[4]}")
+            sys.exit(1)
+    
+    if len(sys.argv) > 5:
+        timings_path = sys.argv[5]
+    
     print(f"\nConfiguration:")
     print(f"  Agents: {num_agents}")
     print(f"  Cycles per Epoch: {cycles_per_epoch}")
     print(f"  Rest between Epochs: {rest_between_epochs}s")
+    print(f"  Seed: {seed}")
+    if timings_path:
+        print(f"  Stage Timings: {timings_path}")
     
-    run_infinite_simulation(num_agents, cycles_per_epoch, rest_between_epochs)
+    run_infinite_simulation(num_agents, cycles_per_epoch, rest_between_epochs, seed,
+                            timings_path=timings_path)
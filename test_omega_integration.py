@@ -0,0 +1,45 @@
+import numpy as np
+
+from omega_integration import FactoredCognitiveState, QuantumCognitiveState
+
+
+def mk(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return QuantumCognitiveState([f"s{i}" for i in range(n)], rng.random(n) + 0.1, rng=rng)
+
+
+def test_factored_chain_after_eager_entangle():
+    a, b, c = mk(8, 1), mk(8, 2), mk(8, 3)
+    f = a.entangle(b).entangle(c)
+    assert isinstance(f, FactoredCognitiveState)
+    assert len(f.components) == 2 and len(f.components[0].states) == 64
+
+    for index in (0, 100, 511):
+        label = f.states[index]
+        assert np.isclose(f.probability(label), f.amplitude(index) ** 2)
+    assert f.probability("s1|s4") == 0.0
+    assert f.probability("s1|s4|s4|s4") == 0.0
+    assert f.probability("s1|s9|s4") == 0.0
+
+    for factor, source in enumerate((a, b, c)):
+        marginal = f.marginal(factor)
+        assert list(marginal) == source.states
+        assert np.allclose(list(marginal.values()), source.amplitudes ** 2)
+
+
+def test_factored_probability_duplicate_label():
+    rng = np.random.default_rng(0)
+    dup = QuantumCognitiveState(["x", "x", "y"], [1.0, 1.0, 1.0], rng=rng)
+    f = FactoredCognitiveState([dup, mk(2)])
+    assert f.probability("x|s0") is None
+    assert np.isclose(f.probability("y|s1"), f.amplitude(5) ** 2)
+    assert np.isclose(f.marginal(0)["x"], 2 / 3)
+
+
+def test_measure_many_returns_arrays():
+    f = FactoredCognitiveState([mk(3, 1), mk(4, 2)])
+    g = FactoredCognitiveState([mk(3, 1), mk(4, 2)])
+    labels = f.measure_many(1000)
+    assert isinstance(labels, np.ndarray)
+    assert isinstance(mk(3).measure_many(5), np.ndarray)
+    assert labels.tolist() == [g.states[i] for i in g.measure_indices(1000)]